@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Literal
 
@@ -9,6 +9,7 @@ from agno.utils.log import log_info, log_warning
 try:
     from openai import AsyncOpenAI
     from openai import OpenAI as OpenAIClient
+    from openai import RateLimitError
     from openai.types.create_embedding_response import CreateEmbeddingResponse
 except ImportError:
     raise ImportError("`openai` not installed")
@@ -63,7 +64,7 @@ class OpenAIEmbedder(Embedder):
         self.async_client = AsyncOpenAI(**filtered_params)
         return self.async_client
 
-    def response(self, text: str) -> CreateEmbeddingResponse:
+    def _get_request_params(self, text: Union[str, List[str]]) -> Dict[str, Any]:
         _request_params: Dict[str, Any] = {
             "input": text,
             "model": self.id,
@@ -76,7 +77,19 @@ class OpenAIEmbedder(Embedder):
             _request_params["dimensions"] = self.dimensions
         if self.request_params:
             _request_params.update(self.request_params)
-        return self.client.embeddings.create(**_request_params)
+        return _request_params
+
+    def response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
+        return self.client.embeddings.create(**self._get_request_params(text))
+
+    @staticmethod
+    def _get_batch_embeddings_and_usage(
+        response: CreateEmbeddingResponse,
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Split a batch response into its embeddings, with the batch usage repeated for each embedding."""
+        batch_embeddings = [data.embedding for data in response.data]
+        usage_dict = response.usage.model_dump() if response.usage else None
+        return batch_embeddings, [usage_dict] * len(batch_embeddings)
 
     def get_embedding(self, text: str) -> List[float]:
         try:
@@ -99,6 +112,41 @@ class OpenAIEmbedder(Embedder):
             log_warning(f"Failed to get embedding and usage: {str(e)}")
             return [], None
 
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings and usage for multiple texts in batches.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        all_embeddings = []
+        all_usage = []
+        log_info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size}")
+
+        for i in range(0, len(texts), self.batch_size):
+            batch_texts = texts[i : i + self.batch_size]
+
+            try:
+                response: CreateEmbeddingResponse = self.response(text=batch_texts)
+                batch_embeddings, batch_usage = self._get_batch_embeddings_and_usage(response)
+                all_embeddings.extend(batch_embeddings)
+                all_usage.extend(batch_usage)
+            except RateLimitError:
+                # Don't fall back to individual calls, it would only add to the rate limiting
+                raise
+            except Exception as e:
+                log_warning(f"Error in batch embedding: {str(e)}")
+                # Fallback to individual calls for this batch
+                for text in batch_texts:
+                    embedding, usage = self.get_embedding_and_usage(text)
+                    all_embeddings.append(embedding)
+                    all_usage.append(usage)
+
+        return all_embeddings, all_usage
+
     async def async_get_embedding(self, text: str) -> List[float]:
         req: Dict[str, Any] = {
             "input": text,
@@ -162,27 +210,16 @@ class OpenAIEmbedder(Embedder):
         for i in range(0, len(texts), self.batch_size):
             batch_texts = texts[i : i + self.batch_size]
 
-            req: Dict[str, Any] = {
-                "input": batch_texts,
-                "model": self.id,
-                "encoding_format": self.encoding_format,
-            }
-            if self.user is not None:
-                req["user"] = self.user
-            # Pass dimensions for text-embedding-3 models or when using custom base_url (third-party APIs)
-            if self.id.startswith("text-embedding-3") or self.base_url is not None:
-                req["dimensions"] = self.dimensions
-            if self.request_params:
-                req.update(self.request_params)
-
             try:
-                response: CreateEmbeddingResponse = await self.aclient.embeddings.create(**req)
-                batch_embeddings = [data.embedding for data in response.data]
+                response: CreateEmbeddingResponse = await self.aclient.embeddings.create(
+                    **self._get_request_params(batch_texts)
+                )
+                batch_embeddings, batch_usage = self._get_batch_embeddings_and_usage(response)
                 all_embeddings.extend(batch_embeddings)
-
-                # For each embedding in the batch, add the same usage information
-                usage_dict = response.usage.model_dump() if response.usage else None
-                all_usage.extend([usage_dict] * len(batch_embeddings))
+                all_usage.extend(batch_usage)
+            except RateLimitError:
+                # Don't fall back to individual calls, it would only add to the rate limiting
+                raise
             except Exception as e:
                 log_warning(f"Error in async batch embedding: {str(e)}")
                 # Fallback to individual calls for this batch
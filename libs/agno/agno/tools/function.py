@@ -1,9 +1,9 @@
 from dataclasses import dataclass
-from functools import partial, wraps
+from functools import lru_cache, partial, wraps
 from importlib.metadata import version
 from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Type, TypeVar, get_type_hints
 
-from docstring_parser import parse
+from docstring_parser import Docstring, parse
 from packaging.version import Version
 from pydantic import BaseModel, Field, validate_call
 
@@ -15,6 +15,16 @@ from agno.utils.log import log_debug, log_exception, log_warning
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=1024)
+def parse_docstring(docstring: str) -> Docstring:
+    """Parse a tool docstring, memoized on its text.
+
+    Toolkits are re-instantiated for every Agent, so the same docstrings are parsed
+    over and over when building tool schemas. Callers must treat the result as read-only.
+    """
+    return parse(docstring)
+
+
 def get_entrypoint_docstring(entrypoint: Callable) -> str:
     from inspect import getdoc
 
@@ -25,7 +35,7 @@ def get_entrypoint_docstring(entrypoint: Callable) -> str:
     if not docstring:
         return ""
 
-    parsed_doc = parse(docstring)
+    parsed_doc = parse_docstring(docstring)
 
     # Combine short and long descriptions
     lines = []
@@ -326,7 +336,7 @@ class Function(BaseModel):
             # Parse docstring for parameters
             param_descriptions: Dict[str, Any] = {}
             if docstring := getdoc(c):
-                parsed_doc = parse(docstring)
+                parsed_doc = parse_docstring(docstring)
                 param_docs = parsed_doc.params
 
                 if param_docs is not None:
@@ -482,7 +492,7 @@ class Function(BaseModel):
             param_descriptions = {}
             param_descriptions_clean = {}
             if docstring := getdoc(self.entrypoint):
-                parsed_doc = parse(docstring)
+                parsed_doc = parse_docstring(docstring)
                 param_docs = parsed_doc.params
 
                 if param_docs is not None:
@@ -1131,9 +1131,10 @@ def handle_event(
     events_to_skip: Optional[List[Union[RunEvent, TeamRunEvent]]] = None,
     store_events: bool = False,
 ) -> Union[RunOutputEvent, TeamRunOutputEvent]:
-    # We only store events that are not run_response_content events
-    _events_to_skip: List[str] = [event.value for event in events_to_skip] if events_to_skip else []
-    if store_events and event.event not in _events_to_skip:
+    # We only store events that are not run_response_content events.
+    # Called once per streamed event: RunEvent/TeamRunEvent are str enums, so compare
+    # against events_to_skip directly instead of rebuilding a list of values each time.
+    if store_events and not (events_to_skip and event.event in events_to_skip):
         if run_response.events is None:
             run_response.events = []
         run_response.events.append(event)  # type: ignore
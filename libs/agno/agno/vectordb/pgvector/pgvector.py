@@ -1,15 +1,18 @@
 import asyncio
+import json
 import re
+from contextlib import asynccontextmanager
 from hashlib import md5
 from math import sqrt
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, AsyncIterator, Dict, List, Optional, Union, cast
 
 from agno.utils.string import generate_id
 
 try:
     from sqlalchemy import and_, not_, or_, update
     from sqlalchemy.dialects import postgresql
-    from sqlalchemy.engine import Engine, create_engine
+    from sqlalchemy.engine import CursorResult, Engine, create_engine
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, scoped_session, sessionmaker
     from sqlalchemy.schema import Column, Index, MetaData, Table
@@ -54,6 +57,7 @@ class PgVector(VectorDb):
         id: Optional[str] = None,
         db_url: Optional[str] = None,
         db_engine: Optional[Engine] = None,
+        async_db_engine: Optional[AsyncEngine] = None,
         embedder: Optional[Embedder] = None,
         search_type: SearchType = SearchType.vector,
         vector_index: Union[Ivfflat, HNSW] = HNSW(),
@@ -77,6 +81,8 @@ class PgVector(VectorDb):
             description (Optional[str]): Description of the vector database.
             db_url (Optional[str]): Database connection URL.
             db_engine (Optional[Engine]): SQLAlchemy database engine.
+            async_db_engine (Optional[AsyncEngine]): SQLAlchemy async engine. When provided, async inserts,
+                upserts and existence checks run natively on it instead of blocking on the sync engine.
             embedder (Optional[Embedder]): Embedder instance for creating embeddings.
             search_type (SearchType): Type of search to perform.
             vector_index (Union[Ivfflat, HNSW]): Vector index configuration.
@@ -160,6 +166,11 @@ class PgVector(VectorDb):
 
         # Database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
+        # Async database session, only when an async engine is provided
+        self.async_db_engine: Optional[AsyncEngine] = async_db_engine
+        self.AsyncSession: Optional[async_sessionmaker[AsyncSession]] = (
+            async_sessionmaker(bind=async_db_engine, expire_on_commit=False) if async_db_engine is not None else None
+        )
         # Database table
         self.table: Table = self.get_table()
         log_debug(f"Initialized PgVector with table '{self.schema}.{self.table_name}'")
@@ -264,6 +275,29 @@ class PgVector(VectorDb):
             log_error(f"Error checking if record exists: {str(e)}")
             return False
 
+    @asynccontextmanager
+    async def _async_session(self) -> AsyncIterator[Union[Session, AsyncSession]]:
+        """Yield a native AsyncSession if an async engine is configured, else a regular Session."""
+        if self.AsyncSession is not None:
+            async with self.AsyncSession() as sess:
+                yield sess
+        else:
+            with self.Session() as sess:
+                yield sess
+
+    async def _async_record_exists(self, column, value) -> bool:
+        """Check if a record with the given column value exists, natively on the async engine if configured."""
+        if self.AsyncSession is None:
+            return await asyncio.to_thread(self._record_exists, column, value)
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                stmt = select(1).where(column == value).limit(1)
+                result = await sess.execute(stmt)
+                return result.first() is not None
+        except Exception as e:
+            log_error(f"Error checking if record exists: {str(e)}")
+            return False
+
     def name_exists(self, name: str) -> bool:
         """
         Check if a document with the given name exists in the table.
@@ -277,8 +311,10 @@ class PgVector(VectorDb):
         return self._record_exists(self.table.c.name, name)
 
     async def async_name_exists(self, name: str) -> bool:
-        """Check if name exists asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.name_exists, name)
+        """Check if name exists asynchronously, natively on the async engine if configured."""
+        if self.AsyncSession is None:
+            return await asyncio.to_thread(self.name_exists, name)
+        return await self._async_record_exists(self.table.c.name, name)
 
     def id_exists(self, id: str) -> bool:
         """
@@ -292,12 +328,24 @@ class PgVector(VectorDb):
         """
         return self._record_exists(self.table.c.id, id)
 
+    async def async_id_exists(self, id: str) -> bool:
+        """Check if id exists asynchronously, natively on the async engine if configured."""
+        if self.AsyncSession is None:
+            return await asyncio.to_thread(self.id_exists, id)
+        return await self._async_record_exists(self.table.c.id, id)
+
     def content_hash_exists(self, content_hash: str) -> bool:
         """
         Check if a document with the given content hash exists in the table.
         """
         return self._record_exists(self.table.c.content_hash, content_hash)
 
+    async def async_content_hash_exists(self, content_hash: str) -> bool:
+        """Check if content hash exists asynchronously, natively on the async engine if configured."""
+        if self.AsyncSession is None:
+            return await asyncio.to_thread(self.content_hash_exists, content_hash)
+        return await self._async_record_exists(self.table.c.content_hash, content_hash)
+
     def _clean_content(self, content: str) -> str:
         """
         Clean the content by replacing null characters.
@@ -310,12 +358,30 @@ class PgVector(VectorDb):
         """
         return content.replace("\x00", "\ufffd")
 
+    def _get_record_id(self, doc: Document, cleaned_content: str, content_hash: str) -> str:
+        """
+        Get the reproducible record ID for a document.
+
+        Args:
+            doc (Document): The document to get the ID for.
+            cleaned_content (str): The document content after _clean_content.
+            content_hash (str): The content hash the document is inserted under.
+
+        Returns:
+            str: The record ID.
+        """
+        # Include content_hash in ID to ensure uniqueness across different content hashes
+        # This allows the same URL/content to be inserted with different descriptions
+        base_id = doc.id or md5(cleaned_content.encode()).hexdigest()
+        return md5(f"{base_id}_{content_hash}".encode()).hexdigest()
+
     def insert(
         self,
         content_hash: str,
         documents: List[Document],
         filters: Optional[Dict[str, Any]] = None,
         batch_size: int = 100,
+        use_copy: bool = False,
     ) -> None:
         """
         Insert documents into the database.
@@ -325,24 +391,39 @@ class PgVector(VectorDb):
             documents (List[Document]): List of documents to insert.
             filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
             batch_size (int): Number of documents to insert in each batch.
+            use_copy (bool): Stream each batch with COPY FROM STDIN instead of INSERT.
+                Only supported with the psycopg (v3) driver; faster for large append-only loads.
         """
+        if use_copy and self.db_engine.dialect.driver != "psycopg":
+            log_warning("COPY insert requires the psycopg driver, falling back to INSERT.")
+            use_copy = False
+
         try:
             with self.Session() as sess:
                 for i in range(0, len(documents), batch_size):
                     batch_docs = documents[i : i + batch_size]
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed the batch in one call if supported, otherwise each record embeds its document
+                        embedded = self._batch_embed_documents(batch_docs)
+
                         # Prepare documents for insertion
                         batch_records = []
                         for doc in batch_docs:
                             try:
-                                batch_records.append(self._get_document_record(doc, filters, content_hash))
+                                batch_records.append(
+                                    self._get_document_record(doc, filters, content_hash, embed=not embedded)
+                                )
                             except Exception as e:
                                 log_error(f"Error processing document '{doc.name}': {str(e)}")
 
                         # Insert the batch of records
-                        insert_stmt = postgresql.insert(self.table)
-                        sess.execute(insert_stmt, batch_records)
+                        if use_copy:
+                            self._copy_records(sess, batch_records)
+                        else:
+                            # Pass records as executemany parameters rather than rendering them into the statement
+                            insert_stmt = postgresql.insert(self.table)
+                            sess.execute(insert_stmt, batch_records)
                         sess.commit()  # Commit batch independently
                         log_info(f"Inserted batch of {len(batch_records)} documents.")
                     except Exception as e:
@@ -353,6 +434,34 @@ class PgVector(VectorDb):
             log_error(f"Error inserting documents: {str(e)}")
             raise
 
+    def _copy_records(self, sess: Session, batch_records: List[Dict[str, Any]]) -> None:
+        """
+        Stream records into the table with COPY FROM STDIN on the session's connection.
+
+        Args:
+            sess (Session): The session whose transaction the COPY runs in.
+            batch_records (List[Dict[str, Any]]): Records built by _get_document_record.
+        """
+        if not batch_records:
+            return
+
+        columns = list(batch_records[0].keys())
+        table_name = self.db_engine.dialect.identifier_preparer.format_table(self.table)
+        copy_sql = f"COPY {table_name} ({', '.join(columns)}) FROM STDIN"
+
+        def to_copy_value(value: Any) -> Any:
+            # COPY text format: JSONB as JSON text, vectors as '[x,y,...]'
+            if isinstance(value, dict):
+                return json.dumps(value)
+            if isinstance(value, (list, tuple)):
+                return "[" + ",".join(str(float(v)) for v in value) + "]"
+            return value
+
+        driver_connection = sess.connection().connection.driver_connection
+        with driver_connection.cursor() as cur, cur.copy(copy_sql) as copy:  # type: ignore[union-attr]
+            for record in batch_records:
+                copy.write_row([to_copy_value(record[column]) for column in columns])
+
     async def async_insert(
         self,
         content_hash: str,
@@ -362,7 +471,7 @@ class PgVector(VectorDb):
     ) -> None:
         """Insert documents asynchronously with parallel embedding."""
         try:
-            with self.Session() as sess:
+            async with self._async_session() as sess:
                 for i in range(0, len(documents), batch_size):
                     batch_docs = documents[i : i + batch_size]
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
@@ -375,10 +484,7 @@ class PgVector(VectorDb):
                         for doc in batch_docs:
                             try:
                                 cleaned_content = self._clean_content(doc.content)
-                                # Include content_hash in ID to ensure uniqueness across different content hashes
-                                # This allows the same URL/content to be inserted with different descriptions
-                                base_id = doc.id or md5(cleaned_content.encode()).hexdigest()
-                                record_id = md5(f"{base_id}_{content_hash}".encode()).hexdigest()
+                                record_id = self._get_record_id(doc, cleaned_content, content_hash)
 
                                 meta_data = doc.meta_data or {}
                                 if filters:
@@ -402,12 +508,20 @@ class PgVector(VectorDb):
                         # Insert the batch of records
                         if batch_records:
                             insert_stmt = postgresql.insert(self.table)
-                            sess.execute(insert_stmt, batch_records)
-                            sess.commit()  # Commit batch independently
+                            if isinstance(sess, AsyncSession):
+                                await sess.execute(insert_stmt, batch_records)
+                                await sess.commit()  # Commit batch independently
+                            else:
+                                sess.execute(insert_stmt, batch_records)
+                                sess.commit()  # Commit batch independently
                             log_info(f"Inserted batch of {len(batch_records)} documents.")
                     except Exception as e:
                         log_error(f"Error with batch starting at index {i}: {str(e)}")
-                        sess.rollback()  # Rollback the current batch if there's an error
+                        # Rollback the current batch if there's an error
+                        if isinstance(sess, AsyncSession):
+                            await sess.rollback()
+                        else:
+                            sess.rollback()
                         raise
         except Exception as e:
             log_error(f"Error inserting documents: {str(e)}")
@@ -431,12 +545,9 @@ class PgVector(VectorDb):
     ) -> None:
         """
         Upsert documents by content hash.
-        First delete all documents with the same content hash.
-        Then upsert the new documents.
+        Documents with the same content hash are replaced by the new documents in one transaction.
         """
         try:
-            if self.content_hash_exists(content_hash):
-                self._delete_by_content_hash(content_hash)
             self._upsert(content_hash, documents, filters, batch_size)
         except Exception as e:
             log_error(f"Error upserting documents by content hash: {str(e)}")
@@ -452,6 +563,9 @@ class PgVector(VectorDb):
         """
         Upsert (insert or update) documents in the database.
 
+        Existing documents with the same content hash are deleted in the same transaction as the upsert,
+        so they are only replaced once every batch has been written.
+
         Args:
             documents (List[Document]): List of documents to upsert.
             filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
@@ -459,15 +573,23 @@ class PgVector(VectorDb):
         """
         try:
             with self.Session() as sess:
+                # A no-op DELETE when nothing matches, so no separate existence check round trip
+                result = sess.execute(self._get_delete_by_content_hash_statement(content_hash))
+                if result.rowcount:
+                    log_info(f"Replacing {result.rowcount} records with content hash '{content_hash}'.")
+
                 for i in range(0, len(documents), batch_size):
                     batch_docs = documents[i : i + batch_size]
                     log_info(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed the batch in one call if supported, otherwise each record embeds its document
+                        embedded = self._batch_embed_documents(batch_docs)
+
                         # Prepare documents for upserting
                         batch_records_dict: Dict[str, Dict[str, Any]] = {}  # Use dict to deduplicate by ID
                         for doc in batch_docs:
                             try:
-                                record = self._get_document_record(doc, filters, content_hash)
+                                record = self._get_document_record(doc, filters, content_hash, embed=not embedded)
                                 # Use the generated record ID (which includes content_hash) for deduplication
                                 batch_records_dict[record["id"]] = record
                             except Exception as e:
@@ -480,40 +602,48 @@ class PgVector(VectorDb):
                             continue
 
                         # Upsert the batch of records
-                        insert_stmt = postgresql.insert(self.table).values(batch_records)
-                        upsert_stmt = insert_stmt.on_conflict_do_update(
-                            index_elements=["id"],
-                            set_={
-                                "name": insert_stmt.excluded.name,
-                                "meta_data": insert_stmt.excluded.meta_data,
-                                "filters": insert_stmt.excluded.filters,
-                                "content": insert_stmt.excluded.content,
-                                "embedding": insert_stmt.excluded.embedding,
-                                "usage": insert_stmt.excluded.usage,
-                                "content_hash": insert_stmt.excluded.content_hash,
-                                "content_id": insert_stmt.excluded.content_id,
-                            },
-                        )
+                        upsert_stmt = self._get_upsert_statement(batch_records)
                         sess.execute(upsert_stmt)
-                        sess.commit()  # Commit batch independently
                         log_info(f"Upserted batch of {len(batch_records)} documents.")
                     except Exception as e:
                         log_error(f"Error with batch starting at index {i}: {str(e)}")
-                        sess.rollback()  # Rollback the current batch if there's an error
+                        sess.rollback()  # Rollback the delete and all batches if there's an error
                         raise
+                sess.commit()
         except Exception as e:
             log_error(f"Error upserting documents: {str(e)}")
             raise
 
+    def _get_upsert_statement(self, batch_records: List[Dict[str, Any]]):
+        """
+        Build a multi-row INSERT ... VALUES ... ON CONFLICT (id) DO UPDATE statement for a batch of records.
+
+        The records are rendered into one statement rather than passed as executemany parameters:
+        SQLAlchemy only batches executemany rows for psycopg when the statement has RETURNING,
+        so the driver would otherwise run the upsert once per row.
+        """
+        insert_stmt = postgresql.insert(self.table).values(batch_records)
+        return insert_stmt.on_conflict_do_update(
+            index_elements=["id"],
+            set_={
+                "name": insert_stmt.excluded.name,
+                "meta_data": insert_stmt.excluded.meta_data,
+                "filters": insert_stmt.excluded.filters,
+                "content": insert_stmt.excluded.content,
+                "embedding": insert_stmt.excluded.embedding,
+                "usage": insert_stmt.excluded.usage,
+                "content_hash": insert_stmt.excluded.content_hash,
+                "content_id": insert_stmt.excluded.content_id,
+            },
+        )
+
     def _get_document_record(
-        self, doc: Document, filters: Optional[Dict[str, Any]] = None, content_hash: str = ""
+        self, doc: Document, filters: Optional[Dict[str, Any]] = None, content_hash: str = "", embed: bool = True
     ) -> Dict[str, Any]:
-        doc.embed(embedder=self.embedder)
+        if embed:
+            doc.embed(embedder=self.embedder)
         cleaned_content = self._clean_content(doc.content)
-        # Include content_hash in ID to ensure uniqueness across different content hashes
-        # This allows the same URL/content to be inserted with different descriptions
-        base_id = doc.id or md5(cleaned_content.encode()).hexdigest()
-        record_id = md5(f"{base_id}_{content_hash}".encode()).hexdigest()
+        record_id = self._get_record_id(doc, cleaned_content, content_hash)
 
         meta_data = doc.meta_data or {}
         if filters:
@@ -531,6 +661,51 @@ class PgVector(VectorDb):
             "content_id": doc.content_id,
         }
 
+    def _is_rate_limit_error(self, error: Exception) -> bool:
+        """Check if the error is a rate limiting error."""
+        if getattr(error, "status_code", None) == 429:
+            return True
+        error_str = str(error).lower()
+        return any(
+            phrase in error_str
+            for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
+        )
+
+    def _batch_embed_documents(self, batch_docs: List[Document]) -> bool:
+        """
+        Embed a batch of documents with a single batch embedding call when the embedder supports it.
+
+        Args:
+            batch_docs: List of documents to embed
+
+        Returns:
+            bool: True if the documents were embedded, False if they still need individual embedding.
+        """
+        if not (self.embedder.enable_batch and hasattr(self.embedder, "get_embeddings_batch_and_usage")):
+            return False
+
+        try:
+            embeddings, usages = self.embedder.get_embeddings_batch_and_usage([doc.content for doc in batch_docs])
+        except Exception as e:
+            # Check if this is a rate limit error - don't fall back as it would make things worse
+            if self._is_rate_limit_error(e):
+                log_error(f"Rate limit detected during batch embedding.: {str(e)}")
+                raise e
+            log_warning(f"Batch embedding failed, falling back to individual embeddings: {str(e)}")
+            return False
+
+        if len(embeddings) != len(batch_docs):
+            log_warning(
+                f"Batch embedding returned {len(embeddings)} embeddings for {len(batch_docs)} documents, "
+                "falling back to individual embeddings"
+            )
+            return False
+
+        for j, doc in enumerate(batch_docs):
+            doc.embedding = embeddings[j]
+            doc.usage = usages[j] if j < len(usages) else None
+        return True
+
     async def _async_embed_documents(self, batch_docs: List[Document]) -> None:
         """
         Embed a batch of documents using either batch embedding or individual embedding.
@@ -558,13 +733,7 @@ class PgVector(VectorDb):
 
             except Exception as e:
                 # Check if this is a rate limit error - don't fall back as it would make things worse
-                error_str = str(e).lower()
-                is_rate_limit = any(
-                    phrase in error_str
-                    for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
-                )
-
-                if is_rate_limit:
+                if self._is_rate_limit_error(e):
                     log_error(f"Rate limit detected during batch embedding.: {str(e)}")
                     raise e
                 else:
@@ -598,12 +767,7 @@ class PgVector(VectorDb):
                 if isinstance(result, Exception):
                     error_msg = str(result)
 
-                    error_str = error_msg.lower()
-                    is_rate_limit = any(
-                        phrase in error_str
-                        for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
-                    )
-                    if is_rate_limit and rate_limit_error is None:
+                    if self._is_rate_limit_error(result) and rate_limit_error is None:
                         rate_limit_error = result
 
                     # If it's an event loop closure error, log it but don't fail
@@ -624,10 +788,8 @@ class PgVector(VectorDb):
         filters: Optional[Dict[str, Any]] = None,
         batch_size: int = 100,
     ) -> None:
-        """Upsert documents asynchronously by running in a thread."""
+        """Upsert documents asynchronously, natively on the async engine if configured."""
         try:
-            if self.content_hash_exists(content_hash):
-                self._delete_by_content_hash(content_hash)
             await self._async_upsert(content_hash, documents, filters, batch_size)
         except Exception as e:
             log_error(f"Error upserting documents by content hash: {str(e)}")
@@ -643,13 +805,25 @@ class PgVector(VectorDb):
         """
         Upsert (insert or update) documents in the database.
 
+        Existing documents with the same content hash are deleted in the same transaction as the upsert,
+        so they are only replaced once every batch has been written.
+
         Args:
             documents (List[Document]): List of documents to upsert.
             filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
             batch_size (int): Number of documents to upsert in each batch.
         """
         try:
-            with self.Session() as sess:
+            async with self._async_session() as sess:
+                # A no-op DELETE when nothing matches, so no separate existence check round trip
+                delete_stmt = self._get_delete_by_content_hash_statement(content_hash)
+                if isinstance(sess, AsyncSession):
+                    result = cast(CursorResult, await sess.execute(delete_stmt))
+                else:
+                    result = cast(CursorResult, sess.execute(delete_stmt))
+                if result.rowcount:
+                    log_info(f"Replacing {result.rowcount} records with content hash '{content_hash}'.")
+
                 for i in range(0, len(documents), batch_size):
                     batch_docs = documents[i : i + batch_size]
                     log_info(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
@@ -662,10 +836,7 @@ class PgVector(VectorDb):
                         for idx, doc in enumerate(batch_docs):
                             try:
                                 cleaned_content = self._clean_content(doc.content)
-                                # Include content_hash in ID to ensure uniqueness across different content hashes
-                                # This allows the same URL/content to be inserted with different descriptions
-                                base_id = doc.id or md5(cleaned_content.encode()).hexdigest()
-                                record_id = md5(f"{base_id}_{content_hash}".encode()).hexdigest()
+                                record_id = self._get_record_id(doc, cleaned_content, content_hash)
 
                                 if (
                                     doc.embedding is not None
@@ -700,27 +871,24 @@ class PgVector(VectorDb):
                             continue
 
                         # Upsert the batch of records
-                        insert_stmt = postgresql.insert(self.table).values(batch_records)
-                        upsert_stmt = insert_stmt.on_conflict_do_update(
-                            index_elements=["id"],
-                            set_={
-                                "name": insert_stmt.excluded.name,
-                                "meta_data": insert_stmt.excluded.meta_data,
-                                "filters": insert_stmt.excluded.filters,
-                                "content": insert_stmt.excluded.content,
-                                "embedding": insert_stmt.excluded.embedding,
-                                "usage": insert_stmt.excluded.usage,
-                                "content_hash": insert_stmt.excluded.content_hash,
-                                "content_id": insert_stmt.excluded.content_id,
-                            },
-                        )
-                        sess.execute(upsert_stmt)
-                        sess.commit()  # Commit batch independently
+                        upsert_stmt = self._get_upsert_statement(batch_records)
+                        if isinstance(sess, AsyncSession):
+                            await sess.execute(upsert_stmt)
+                        else:
+                            sess.execute(upsert_stmt)
                         log_info(f"Upserted batch of {len(batch_records)} documents.")
                     except Exception as e:
                         log_error(f"Error with batch starting at index {i}: {str(e)}")
-                        sess.rollback()  # Rollback the current batch if there's an error
+                        # Rollback the delete and all batches if there's an error
+                        if isinstance(sess, AsyncSession):
+                            await sess.rollback()
+                        else:
+                            sess.rollback()
                         raise
+                if isinstance(sess, AsyncSession):
+                    await sess.commit()
+                else:
+                    sess.commit()
         except Exception as e:
             log_error(f"Error upserting documents: {str(e)}")
             raise
@@ -1282,6 +1450,51 @@ class PgVector(VectorDb):
         self._create_gin_index(force_recreate=force_recreate)
         log_debug("==== Optimized Vector DB ====")
 
+    def bulk_load(
+        self,
+        content_hash: str,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100,
+        use_copy: bool = False,
+    ) -> None:
+        """
+        Insert a large set of documents with the vector index dropped, then rebuild the index once.
+
+        Building an HNSW/IVFFlat index over loaded rows is much cheaper than maintaining it on every insert.
+        The index is only rebuilt if it existed before the load, and is rebuilt even if the insert fails.
+        If the insert fails, that error is raised; a rebuild error is then only logged. Otherwise a rebuild error is raised.
+        Index build settings such as maintenance_work_mem can be passed via the vector index configuration.
+
+        Args:
+            content_hash (str): The content hash to insert.
+            documents (List[Document]): List of documents to insert.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
+            batch_size (int): Number of documents to insert in each batch.
+            use_copy (bool): Stream each batch with COPY FROM STDIN instead of INSERT.
+        """
+        index_name = self._get_vector_index_name() if self.vector_index is not None else None
+        rebuild_index = index_name is not None and self._index_exists(index_name)
+        if rebuild_index:
+            log_info(f"Dropping vector index '{index_name}' for bulk load.")
+            self._drop_index(index_name)  # type: ignore[arg-type]
+
+        try:
+            self.insert(content_hash, documents, filters=filters, batch_size=batch_size, use_copy=use_copy)
+        except Exception:
+            if rebuild_index:
+                log_info(f"Rebuilding vector index '{index_name}' after failed bulk load.")
+                try:
+                    self._create_vector_index()
+                except Exception as e:
+                    # Keep the insert error as the one raised to the caller
+                    log_error(f"Error rebuilding vector index '{index_name}' after failed bulk load: {str(e)}")
+            raise
+
+        if rebuild_index:
+            log_info(f"Rebuilding vector index '{index_name}' after bulk load.")
+            self._create_vector_index()
+
     def _index_exists(self, index_name: str) -> bool:
         """
         Check if an index with the given name exists.
@@ -1311,6 +1524,18 @@ class PgVector(VectorDb):
             log_error(f"Error dropping index '{index_name}': {str(e)}")
             raise
 
+    def _get_vector_index_name(self) -> str:
+        """
+        Get the vector index name, generating it from the table name if not provided.
+
+        Returns:
+            str: The name of the vector index.
+        """
+        if self.vector_index.name is None:
+            index_type = "ivfflat" if isinstance(self.vector_index, Ivfflat) else "hnsw"
+            self.vector_index.name = f"{self.table_name}_{index_type}_index"
+        return self.vector_index.name
+
     def _create_vector_index(self, force_recreate: bool = False) -> None:
         """
         Create or recreate the vector index.
@@ -1323,9 +1548,7 @@ class PgVector(VectorDb):
             return
 
         # Generate index name if not provided
-        if self.vector_index.name is None:
-            index_type = "ivfflat" if isinstance(self.vector_index, Ivfflat) else "hnsw"
-            self.vector_index.name = f"{self.table_name}_{index_type}_index"
+        vector_index_name = self._get_vector_index_name()
 
         # Determine index distance operator
         index_distance = {
@@ -1338,15 +1561,15 @@ class PgVector(VectorDb):
         table_fullname = self.table.fullname  # includes schema if any
 
         # Check if vector index already exists
-        vector_index_exists = self._index_exists(self.vector_index.name)
+        vector_index_exists = self._index_exists(vector_index_name)
 
         if vector_index_exists:
-            log_info(f"Vector index '{self.vector_index.name}' already exists.")
+            log_info(f"Vector index '{vector_index_name}' already exists.")
             if force_recreate:
-                log_info(f"Force recreating vector index '{self.vector_index.name}'. Dropping existing index.")
-                self._drop_index(self.vector_index.name)
+                log_info(f"Force recreating vector index '{vector_index_name}'. Dropping existing index.")
+                self._drop_index(vector_index_name)
             else:
-                log_info(f"Skipping vector index creation as index '{self.vector_index.name}' already exists.")
+                log_info(f"Skipping vector index creation as index '{vector_index_name}' already exists.")
                 return
 
         # Proceed to create the vector index
@@ -1366,7 +1589,7 @@ class PgVector(VectorDb):
                     log_error(f"Unknown index type: {type(self.vector_index)}")
                     return
         except Exception as e:
-            log_error(f"Error creating vector index '{self.vector_index.name}': {str(e)}")
+            log_error(f"Error creating vector index '{vector_index_name}': {str(e)}")
             raise
 
     def _create_ivfflat_index(self, sess: Session, table_fullname: str, index_distance: str) -> None:
@@ -1552,16 +1775,23 @@ class PgVector(VectorDb):
             sess.rollback()
             return False
 
+    def _get_delete_by_content_hash_statement(self, content_hash: str):
+        """Build the DELETE statement for all records with the given content hash."""
+        return self.table.delete().where(self.table.c.content_hash == content_hash)
+
     def _delete_by_content_hash(self, content_hash: str) -> bool:
         """
         Delete content by content hash.
         """
         try:
             with self.Session() as sess, sess.begin():
-                stmt = self.table.delete().where(self.table.c.content_hash == content_hash)
-                sess.execute(stmt)
+                stmt = self._get_delete_by_content_hash_statement(content_hash)
+                result = sess.execute(stmt)
                 sess.commit()
-                log_info(f"Deleted records with content hash '{content_hash}' from table '{self.table.fullname}'.")
+                if result.rowcount:
+                    log_info(
+                        f"Deleted {result.rowcount} records with content hash '{content_hash}' from table '{self.table.fullname}'."
+                    )
                 return True
         except Exception as e:
             log_error(f"Error deleting rows from table '{self.table.fullname}': {str(e)}")
@@ -1589,8 +1819,8 @@ class PgVector(VectorDb):
         for k, v in self.__dict__.items():
             if k in {"metadata", "table"}:
                 continue
-            # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "Session", "embedder"}:
+            # Reuse engines and sessions without copying
+            elif k in {"db_engine", "Session", "async_db_engine", "AsyncSession", "embedder"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
@@ -1,4 +1,12 @@
+import functools
+import os
+import shutil
+from pathlib import Path
+from typing import Callable
+
+import httpx
 import pytest
+import pytest_asyncio
 
 
 @pytest.hookimpl(hookwrapper=True)
@@ -19,3 +27,99 @@ def pytest_runtest_makereport(item, call):
             if any(p in combined for p in ["429", "rate limit", "rate_limit", "quota", "resource_exhausted"]):
                 report.outcome = "skipped"
                 report.longrepr = ("", -1, "Skipped: Vercel rate limit (429)")
+
+
+FAKE_TOOLS = bool(os.getenv("AGNO_FAKE_TOOLS"))
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--refresh-tool-cache",
+        action="store_true",
+        default=False,
+        help="Purge the AGNO_TOOL_CACHE_DIR tool result cache before running the tests.",
+    )
+
+
+@pytest.fixture(scope="session")
+def tool_cache_dir(request, tmp_path_factory) -> str:
+    """Cache directory for tool results.
+
+    Defaults to a fresh per-worker temp directory, so every run calls the real tool
+    APIs. Set `AGNO_TOOL_CACHE_DIR` to opt into a persistent cache that replays
+    YFinance and web search results across runs instead.
+    """
+    persistent_cache_dir = os.getenv("AGNO_TOOL_CACHE_DIR")
+    if not persistent_cache_dir:
+        return str(tmp_path_factory.mktemp("tool_cache"))
+
+    cache_dir = Path(persistent_cache_dir)
+    if FAKE_TOOLS:
+        # Keep canned results out of the cache that real-API runs replay
+        cache_dir = cache_dir / "fake"
+    if request.config.getoption("--refresh-tool-cache", default=False):
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return str(cache_dir)
+
+
+@pytest.fixture(scope="session")
+def http_client():
+    """One pooled HTTP client shared by every sync V0 model in the session.
+
+    Reusing its keep-alive connections avoids a fresh TCP/TLS handshake per test.
+    """
+    client = httpx.Client(limits=HTTP_LIMITS, timeout=30)
+    yield client
+    client.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_http_client():
+    """Async counterpart of `http_client`.
+
+    An AsyncClient is bound to the event loop it first runs on, so the tests using
+    it must run on the session loop too (`@pytest.mark.asyncio(loop_scope="session")`).
+    """
+    client = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=30)
+    yield client
+    await client.aclose()
+
+
+def _canned(method: Callable, result: str) -> Callable:
+    # functools.wraps keeps the signature and docstring, so the tool schema sent to
+    # the model is the same as for the real method.
+    @functools.wraps(method)
+    def fake(self, *args, **kwargs) -> str:
+        return result
+
+    return fake
+
+
+@pytest.fixture(autouse=True)
+def fake_tools(monkeypatch):
+    """With AGNO_FAKE_TOOLS=1, replace the YFinance/web search/Exa calls with canned results.
+
+    The model round trip stays real, but the external tool APIs (the slowest and
+    flakiest part of these tests) are never hit. Run without the flag for real-API coverage.
+    """
+    if not FAKE_TOOLS:
+        return
+
+    from agno.tools.exa import ExaTools
+    from agno.tools.websearch import WebSearchTools
+    from agno.tools.yfinance import YFinanceTools
+
+    canned_results = [
+        (YFinanceTools, "get_current_stock_price", "TSLA: $250.00"),
+        (WebSearchTools, "search_news", "Latest news headlines: Tesla (TSLA) shares move after delivery report"),
+        (WebSearchTools, "web_search", "Latest news headlines: Tesla (TSLA) shares move after delivery report"),
+        (ExaTools, "get_contents", "Both papers are about large language models (LLMs)."),
+    ]
+    for toolkit, name, result in canned_results:
+        monkeypatch.setattr(toolkit, name, _canned(getattr(toolkit, name), result))
+
+    # ExaTools still builds its Exa client, which requires a key, even though get_contents is faked
+    if not os.getenv("EXA_API_KEY"):
+        monkeypatch.setenv("EXA_API_KEY", "fake-exa-key")
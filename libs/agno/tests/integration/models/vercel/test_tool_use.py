@@ -1,141 +1,209 @@
-from typing import Optional
+import asyncio
+import queue
+import re
+import threading
+from typing import Any, AsyncIterator, Iterator, List, Optional
 
 import pytest
 
 from agno.agent import Agent
+from agno.models.message import Message
 from agno.models.vercel import V0
+from agno.tools import tool
 from agno.tools.exa import ExaTools
 from agno.tools.websearch import WebSearchTools
 from agno.tools.yfinance import YFinanceTools
 
+pytestmark = [
+    # Bound each test so a stalled provider or tool endpoint fails fast instead of
+    # hanging the suite, and retry transient network failures.
+    pytest.mark.timeout(60),
+    pytest.mark.flaky(reruns=2, reruns_delay=1),
+]
+
+TOOL_CALL_EVENTS = frozenset({"ToolCallStarted", "ToolCallCompleted"})
+FIND_TSLA = re.compile(r"TSLA").search
+TSLA_PROMPT = "What is the current price of TSLA?"
+STREAM_BUFFER_SIZE = 64
+_STREAM_END = object()
+
+
+def buffered(stream: Iterator[Any]) -> Iterator[Any]:
+    """Drain `stream` on a background thread into a bounded queue.
+
+    The producer keeps reading from the model while the test inspects earlier
+    chunks, and the bound applies backpressure if the consumer falls behind.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=STREAM_BUFFER_SIZE)
+    errors: List[BaseException] = []
+
+    def produce() -> None:
+        try:
+            for item in stream:
+                buffer.put(item)
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            buffer.put(_STREAM_END)
+
+    threading.Thread(target=produce, daemon=True).start()
+    while (item := buffer.get()) is not _STREAM_END:
+        yield item
+    if errors:
+        raise errors[0]
+
+
+async def abuffered(stream: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    """Async counterpart of `buffered`, with the producer running as a separate task."""
+    buffer: asyncio.Queue = asyncio.Queue(maxsize=STREAM_BUFFER_SIZE)
+
+    async def produce() -> None:
+        try:
+            async for item in stream:
+                await buffer.put(item)
+        finally:
+            await buffer.put(_STREAM_END)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while (item := await buffer.get()) is not _STREAM_END:
+            yield item
+        # Surfaces any exception raised while producing
+        await producer
+    finally:
+        producer.cancel()
+
+
+def has_assistant_tool_call(messages: List[Message]) -> bool:
+    return next((msg for msg in messages if msg.role == "assistant" and msg.tool_calls), None) is not None
+
+
+class TslaStreamCheck:
+    """Tracks what the TSLA streaming assertions need without retaining the stream."""
+
+    def __init__(self):
+        self.num_responses = 0
+        self.tool_call_seen = False
+        self.found_tsla = False
+        # Keep only the last few characters of the previous chunk so "TSLA" is found
+        # even when it is split across chunks.
+        self.tail = ""
+
+    def observe(self, response: Any) -> None:
+        self.num_responses += 1
+        if not self.found_tsla and response.content:
+            combined = self.tail + response.content
+            self.found_tsla = FIND_TSLA(combined) is not None
+            self.tail = combined[-3:]
 
-def test_tool_use():
-    agent = Agent(
-        model=V0(id="v0-1.0-md"),
-        tools=[YFinanceTools(cache_results=True)],
-        markdown=True,
-        telemetry=False,
-    )
+        # Check for ToolCallStartedEvent or ToolCallCompletedEvent
+        if response.event in TOOL_CALL_EVENTS and getattr(response, "tool", None) and response.tool.tool_name:
+            self.tool_call_seen = True
+
+    def assert_ok(self) -> None:
+        assert self.num_responses > 0
+        assert self.tool_call_seen, "No tool calls observed in stream"
+        assert self.found_tsla
 
-    response = agent.run("What is the current price of TSLA?")
 
+def assert_tsla_response(response: Any) -> None:
     # Verify tool usage
     assert response.messages is not None
-    assert any(msg.tool_calls for msg in response.messages)
+    assert has_assistant_tool_call(response.messages)
     assert response.content is not None
     assert "TSLA" in response.content
 
 
-def test_tool_use_stream():
-    agent = Agent(
-        model=V0(id="v0-1.0-md"),
-        tools=[YFinanceTools(cache_results=True)],
-        markdown=True,
-        telemetry=False,
-    )
-
-    responses = []
-    tool_call_seen = False
-
-    for response in agent.run("What is the current price of TSLA?", stream=True, stream_events=True):
-        responses.append(response)
-
-        # Check for ToolCallStartedEvent or ToolCallCompletedEvent
-        if response.event in ["ToolCallStarted", "ToolCallCompleted"] and hasattr(response, "tool") and response.tool:
-            if response.tool.tool_name:  # type: ignore
-                tool_call_seen = True
-
-    assert len(responses) > 0
-    assert tool_call_seen, "No tool calls observed in stream"
-    full_content = ""
-    for r in responses:
-        full_content += r.content or ""
-    assert "TSLA" in full_content
-
-
-@pytest.mark.asyncio
-async def test_async_tool_use():
-    agent = Agent(
-        model=V0(id="v0-1.0-md"),
-        tools=[YFinanceTools(cache_results=True)],
-        markdown=True,
+def tsla_agent(http_client: Any, tool_cache_dir: Any) -> Agent:
+    return Agent(
+        model=V0(id="v0-1.0-md", http_client=http_client),
+        tools=[YFinanceTools(cache_results=True, cache_dir=tool_cache_dir)],
         telemetry=False,
     )
 
-    response = await agent.arun("What is the current price of TSLA?")
 
-    # Verify tool usage
-    assert response.messages is not None
-    assert any(msg.tool_calls for msg in response.messages if msg.role == "assistant")
-    assert response.content is not None
-    assert "TSLA" in response.content
+@pytest.mark.parametrize("stream", [False, True], ids=["no_stream", "stream"])
+def test_tool_use(tool_cache_dir, http_client, stream):
+    agent = tsla_agent(http_client, tool_cache_dir)
 
+    if not stream:
+        assert_tsla_response(agent.run(TSLA_PROMPT))
+        return
 
-@pytest.mark.asyncio
-async def test_async_tool_use_stream():
-    agent = Agent(
-        model=V0(id="v0-1.0-md"),
-        tools=[YFinanceTools(cache_results=True)],
-        markdown=True,
-        telemetry=False,
-    )
+    check = TslaStreamCheck()
+    for chunk in buffered(agent.run(TSLA_PROMPT, stream=True, stream_events=True)):
+        check.observe(chunk)
+    check.assert_ok()
 
-    responses = []
-    tool_call_seen = False
 
-    async for response in agent.arun("What is the current price of TSLA?", stream=True, stream_events=True):
-        responses.append(response)
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("stream", [False, True], ids=["no_stream", "stream"])
+async def test_async_tool_use(tool_cache_dir, async_http_client, stream):
+    agent = tsla_agent(async_http_client, tool_cache_dir)
 
-        # Check for ToolCallStartedEvent or ToolCallCompletedEvent
-        if response.event in ["ToolCallStarted", "ToolCallCompleted"] and hasattr(response, "tool") and response.tool:
-            if response.tool.tool_name:  # type: ignore
-                tool_call_seen = True
+    if not stream:
+        assert_tsla_response(await agent.arun(TSLA_PROMPT))
+        return
 
-    assert len(responses) > 0
-    assert tool_call_seen, "No tool calls observed in stream"
-    full_content = ""
-    for r in responses:
-        full_content += r.content or ""
-    assert "TSLA" in full_content
+    check = TslaStreamCheck()
+    async for chunk in abuffered(agent.arun(TSLA_PROMPT, stream=True, stream_events=True)):
+        check.observe(chunk)
+    check.assert_ok()
 
 
-def test_multiple_tool_calls():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_multiple_tool_calls(tool_cache_dir, async_http_client):
     agent = Agent(
-        model=V0(id="v0-1.0-md"),
-        tools=[YFinanceTools(cache_results=True), WebSearchTools(cache_results=True)],
+        model=V0(id="v0-1.0-md", http_client=async_http_client),
+        tools=[
+            YFinanceTools(cache_results=True, cache_dir=tool_cache_dir),
+            WebSearchTools(cache_results=True, cache_dir=tool_cache_dir),
+        ],
         instructions=[
             "Use YFinance for stock price queries",
             "Use DuckDuckGo for news and general information",
             "When both price and news are requested, use both tools",
         ],
-        markdown=True,
         telemetry=False,
     )
 
-    response = agent.run("What is the current price of TSLA and search for the latest news about it?")
+    # arun dispatches independent tool calls concurrently, so the price lookup and
+    # the news search overlap instead of running back to back.
+    response = await agent.arun("What is the current price of TSLA and search for the latest news about it?")
 
     # Verify tool usage
-    assert response.messages is not None
-    tool_calls = []
-    for msg in response.messages:
-        if msg.tool_calls:
-            tool_calls.extend(msg.tool_calls)
-    assert len([call for call in tool_calls if call.get("type", "") == "function"]) >= 2
+    messages = response.messages
+    assert messages is not None
+    tool_calls = [call for msg in messages if msg.tool_calls for call in msg.tool_calls]
+    assert sum(1 for call in tool_calls if call.get("type") == "function") >= 2
     assert response.content is not None
     assert "TSLA" in response.content and "latest news" in response.content.lower()
 
 
-def test_tool_call_custom_tool_no_parameters():
-    def get_the_weather_in_tokyo():
-        """
-        Get the weather in Tokyo
-        """
+def get_the_weather_in_tokyo():
+    """
+    Get the weather in Tokyo
+    """
+    return "It is currently 70 degrees and cloudy in Tokyo"
+
+
+def get_the_weather(city: Optional[str] = None):
+    """
+    Get the weather in a city
+
+    Args:
+        city: The city to get the weather for
+    """
+    if city is None:
         return "It is currently 70 degrees and cloudy in Tokyo"
+    else:
+        return f"It is currently 70 degrees and cloudy in {city}"
+
 
+def test_tool_call_custom_tool_no_parameters(http_client):
     agent = Agent(
-        model=V0(id="v0-1.0-md"),
+        model=V0(id="v0-1.0-md", http_client=http_client),
         tools=[get_the_weather_in_tokyo],
-        markdown=True,
         telemetry=False,
     )
 
@@ -143,28 +211,15 @@ def test_tool_call_custom_tool_no_parameters():
 
     # Verify tool usage
     assert response.messages is not None
-    assert any(msg.tool_calls for msg in response.messages)
+    assert has_assistant_tool_call(response.messages)
     assert response.content is not None
     assert "70" in response.content
 
 
-def test_tool_call_custom_tool_optional_parameters():
-    def get_the_weather(city: Optional[str] = None):
-        """
-        Get the weather in a city
-
-        Args:
-            city: The city to get the weather for
-        """
-        if city is None:
-            return "It is currently 70 degrees and cloudy in Tokyo"
-        else:
-            return f"It is currently 70 degrees and cloudy in {city}"
-
+def test_tool_call_custom_tool_optional_parameters(http_client):
     agent = Agent(
-        model=V0(id="v0-1.0-md"),
+        model=V0(id="v0-1.0-md", http_client=http_client),
         tools=[get_the_weather],
-        markdown=True,
         telemetry=False,
     )
 
@@ -172,17 +227,26 @@ def test_tool_call_custom_tool_optional_parameters():
 
     # Verify tool usage
     assert response.messages is not None
-    assert any(msg.tool_calls for msg in response.messages)
+    assert has_assistant_tool_call(response.messages)
     assert response.content is not None
     assert "70" in response.content
 
 
-def test_tool_call_list_parameters():
+def get_paper_contents(urls: List[str]) -> str:
+    """
+    Fetch the contents of several papers in one batch
+
+    Args:
+        urls: Every paper URL to fetch, passed together in a single call
+    """
+    return ExaTools().get_contents(urls=urls)
+
+
+def test_tool_call_list_parameters(tool_cache_dir, http_client):
     agent = Agent(
-        model=V0(id="v0-1.0-md"),
-        tools=[ExaTools()],
-        instructions="Use a single tool call if possible",
-        markdown=True,
+        model=V0(id="v0-1.0-md", http_client=http_client),
+        tools=[tool(cache_results=True, cache_dir=tool_cache_dir)(get_paper_contents)],
+        instructions="Call get_paper_contents exactly once with all URLs.",
         telemetry=False,
     )
 
@@ -191,13 +255,9 @@ def test_tool_call_list_parameters():
     )
 
     # Verify tool usage
-    assert response.messages is not None
-    assert any(msg.tool_calls for msg in response.messages)
-    tool_calls = []
-    for msg in response.messages:
-        if msg.tool_calls:
-            tool_calls.extend(msg.tool_calls)
-    for call in tool_calls:
-        if call.get("type", "") == "function":
-            assert call["function"]["name"] in ["find_similar", "search_exa", "get_contents", "exa_answer"]
+    messages = response.messages
+    assert messages is not None
+    tool_calls = [call for msg in messages if msg.tool_calls for call in msg.tool_calls]
+    assert len(tool_calls) == 1
+    assert tool_calls[0]["function"]["name"] == "get_paper_contents"
     assert response.content is not None
@@ -1,3 +1,10 @@
+import hashlib
+import os
+import pickle
+import warnings
+from pathlib import Path
+from typing import Any, Iterator
+
 import pytest
 
 
@@ -19,3 +26,92 @@ def pytest_runtest_makereport(item, call):
             if any(p in combined for p in ["429", "rate limit", "rate_limit", "quota", "resource_exhausted"]):
                 report.outcome = "skipped"
                 report.longrepr = ("", -1, "Skipped: rate limit (429)")
+
+
+@pytest.fixture(scope="module")
+def gpt4o_mini():
+    """Team model shared by the synchronous tests of a module.
+
+    OpenAIChat caches its HTTP client, so reusing one instance also reuses its
+    connection pool. Async tests should build their own model: the cached async
+    client is bound to the event loop of the test that created it.
+    """
+    from agno.models.openai.chat import OpenAIChat
+
+    return OpenAIChat(id="gpt-4o-mini")
+
+
+@pytest.fixture(scope="module")
+def o3_mini():
+    """Module-scoped o3-mini model, see `gpt4o_mini`."""
+    from agno.models.openai.chat import OpenAIChat
+
+    return OpenAIChat(id="o3-mini")
+
+
+REPLAY_EVENTS = bool(os.getenv("AGNO_REPLAY_TEAM_EVENTS"))
+EVENT_CASSETTE_DIR = Path(os.getenv("AGNO_EVENT_CASSETTE_DIR", Path(__file__).parent / ".cassettes"))
+
+
+@pytest.fixture
+def replay_stream(request):
+    """Run `team.run(..., stream=True)` and optionally record/replay its event stream.
+
+    Only meant for tests that assert on the shape of the stream and do not
+    inspect the team, its session or its db afterwards. Replay is opt-in via
+    AGNO_REPLAY_TEAM_EVENTS: the first run records the events to a pickle under
+    EVENT_CASSETTE_DIR, later runs read them back without calling the model.
+    Delete the directory to re-record.
+    """
+
+    def _run(team, input, **kwargs) -> Iterator[Any]:
+        if not REPLAY_EVENTS:
+            return team.run(input, stream=True, **kwargs)
+
+        model_id = team.model.id if team.model is not None else None
+        key = repr((request.node.nodeid, model_id, input, sorted(kwargs.items())))
+        path = EVENT_CASSETTE_DIR / f"{hashlib.sha256(key.encode()).hexdigest()}.pkl"
+        if path.exists():
+            with path.open("rb") as f:
+                return iter(pickle.load(f))
+
+        events = list(team.run(input, stream=True, **kwargs))
+        try:
+            payload = pickle.dumps(events)
+        except Exception as e:
+            warnings.warn(f"Not recording events for {request.node.nodeid}: {e}")
+        else:
+            EVENT_CASSETTE_DIR.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(payload)
+        return iter(events)
+
+    return _run
+
+
+@pytest.fixture(scope="module")
+def calculator_tools():
+    """Toolkits are safe to share: agents and teams deep-copy their functions on every run."""
+    from agno.tools.calculator import CalculatorTools
+
+    return CalculatorTools()
+
+
+@pytest.fixture(scope="module")
+def reasoning_tools():
+    from agno.tools.reasoning import ReasoningTools
+
+    return ReasoningTools(add_instructions=True)
+
+
+@pytest.fixture(scope="module")
+def yfinance_tools():
+    from agno.tools.yfinance import YFinanceTools
+
+    return YFinanceTools(cache_results=True)
+
+
+@pytest.fixture(scope="module")
+def websearch_tools():
+    from agno.tools.websearch import WebSearchTools
+
+    return WebSearchTools(cache_results=True)
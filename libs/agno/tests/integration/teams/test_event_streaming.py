@@ -1,4 +1,7 @@
+import asyncio
+from collections import Counter, defaultdict
 from textwrap import dedent
+from typing import Any, AsyncIterator, DefaultDict, Dict, Iterator, List, Tuple
 
 import pytest
 from pydantic import BaseModel
@@ -6,28 +9,166 @@ from pydantic import BaseModel
 from agno.agent import RunEvent
 from agno.agent.agent import Agent
 from agno.db.in_memory.in_memory_db import InMemoryDb
+from agno.db.sqlite import SqliteDb
 from agno.models.openai.chat import OpenAIChat
+from agno.run.team import RunCompletedEvent as TeamRunCompletedEvent
 from agno.run.team import TeamRunInput, TeamRunOutput
 from agno.team import Team, TeamRunEvent
-from agno.tools.calculator import CalculatorTools
 from agno.tools.decorator import tool
-from agno.tools.reasoning import ReasoningTools
-from agno.tools.websearch import WebSearchTools
-from agno.tools.yfinance import YFinanceTools
 
+REASONING_INSTRUCTIONS = dedent("""\
+    You are an expert problem-solving assistant with strong analytical skills! 🧠
+    Use step-by-step reasoning to solve the problem.
+    \
+""")
 
-def test_basic_events():
+BASIC_EVENTS = frozenset(
+    {
+        TeamRunEvent.run_started,
+        TeamRunEvent.model_request_started,
+        TeamRunEvent.model_request_completed,
+        TeamRunEvent.run_content,
+        TeamRunEvent.run_content_completed,
+        TeamRunEvent.run_completed,
+    }
+)
+TOOL_EVENTS = BASIC_EVENTS | {TeamRunEvent.tool_call_started, TeamRunEvent.tool_call_completed}
+REASONING_EVENTS = TOOL_EVENTS | {
+    TeamRunEvent.reasoning_started,
+    TeamRunEvent.reasoning_completed,
+    TeamRunEvent.reasoning_step,
+}
+MEMORY_EVENTS = BASIC_EVENTS | {TeamRunEvent.memory_update_started, TeamRunEvent.memory_update_completed}
+SESSION_SUMMARY_EVENTS = BASIC_EVENTS | {
+    TeamRunEvent.session_summary_started,
+    TeamRunEvent.session_summary_completed,
+}
+PRE_HOOK_EVENTS = BASIC_EVENTS | {TeamRunEvent.pre_hook_started, TeamRunEvent.pre_hook_completed}
+POST_HOOK_EVENTS = BASIC_EVENTS | {TeamRunEvent.post_hook_started, TeamRunEvent.post_hook_completed}
+PRE_AND_POST_HOOK_EVENTS = PRE_HOOK_EVENTS | POST_HOOK_EVENTS
+PARSER_MODEL_EVENTS = BASIC_EVENTS | {
+    TeamRunEvent.parser_model_response_started,
+    TeamRunEvent.parser_model_response_completed,
+}
+# Core events that must always be present when a team delegates to member agents
+MEMBER_DELEGATION_EVENTS = TOOL_EVENTS | {
+    RunEvent.run_started,
+    RunEvent.model_request_started,
+    RunEvent.model_request_completed,
+    RunEvent.tool_call_started,
+    RunEvent.tool_call_completed,
+    RunEvent.run_content_completed,
+    RunEvent.run_completed,
+}
+# Events streamed when only member events are forwarded (stream_events=False)
+MEMBER_ONLY_EVENTS = frozenset(
+    {
+        RunEvent.run_started,
+        RunEvent.model_request_started,
+        RunEvent.model_request_completed,
+        RunEvent.tool_call_started,
+        RunEvent.tool_call_completed,
+        RunEvent.run_content_completed,
+        RunEvent.run_completed,
+        TeamRunEvent.run_content,
+    }
+)
+
+
+def collect_events(stream: Iterator[Any]) -> DefaultDict[str, List[Any]]:
+    """Bucket streamed events by event type, preserving arrival order within each bucket."""
+    events: DefaultDict[str, List[Any]] = defaultdict(list)
+    # Bind the lookup locally: this loop runs once per streamed token
+    get_bucket = events.__getitem__
+    for event in stream:
+        get_bucket(event.event).append(event)
+    return events
+
+
+def tally_events(stream: Iterator[Any]) -> Tuple[Counter, Dict[str, Any]]:
+    """Count streamed events by event type and keep the first event of each type.
+
+    Cheaper than `collect_events` for tests that only assert on counts and on the
+    first event of a kind: no per-token list appends, the counting runs in C.
+    """
+    deltas = list(stream)
+    first: Dict[str, Any] = {}
+    for delta in deltas:
+        first.setdefault(delta.event, delta)
+    return Counter(delta.event for delta in deltas), first
+
+
+async def acollect_events(stream: AsyncIterator[Any]) -> DefaultDict[str, List[Any]]:
+    """Async counterpart of `collect_events`."""
+    events: DefaultDict[str, List[Any]] = defaultdict(list)
+    get_bucket = events.__getitem__
+    async for event in stream:
+        get_bucket(event.event).append(event)
+    return events
+
+
+async def acount_events(stream: AsyncIterator[Any], maxsize: int = 256) -> Counter:
+    """Count streamed events by type, draining the stream in a separate task.
+
+    The producer keeps reading the model stream while the consumer is scheduled;
+    the bounded queue applies backpressure if counting ever falls behind.
+    """
+    queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=maxsize)
+
+    async def produce() -> None:
+        try:
+            async for event in stream:
+                await queue.put(event)
+        finally:
+            await queue.put(None)
+
+    async def consume() -> Counter:
+        counts: Counter = Counter()
+        while (event := await queue.get()) is not None:
+            counts[event.event] += 1
+        return counts
+
+    _, counts = await asyncio.gather(produce(), consume())
+    return counts
+
+
+# Tests on the module-scoped db run on the same xdist worker under `--dist=loadgroup`,
+# so the db is created once; every other test is free to spread across workers.
+shared_db_group = pytest.mark.xdist_group("team_event_streaming_db")
+
+
+@pytest.fixture(scope="module")
+def shared_db(tmp_path_factory):
+    """One SQLite db for the whole module, overriding the per-test `shared_db`.
+
+    Connecting and creating the tables once is enough here: `_clean_shared_db`
+    empties it again after every test.
+    """
+    return SqliteDb(session_table="team_event_sessions", db_file=str(tmp_path_factory.mktemp("db") / "events.db"))
+
+
+@pytest.fixture(autouse=True)
+def _clean_shared_db(request):
+    yield
+    if "shared_db" not in request.fixturenames:
+        return
+    db = request.getfixturevalue("shared_db")
+    sessions, _ = db.get_sessions(deserialize=False)
+    if sessions:
+        db.delete_sessions([session["session_id"] for session in sessions])
+    db.clear_memories()
+
+
+def test_basic_events(replay_stream, gpt4o_mini):
     team = Team(
-        model=OpenAIChat(id="gpt-4o-mini"),
+        model=gpt4o_mini,
         members=[],
         telemetry=False,
     )
 
-    response_generator = team.run("Hello, how are you?", stream=True, stream_events=False)
+    response_generator = replay_stream(team, "Hello, how are you?", stream_events=False)
 
-    event_counts = {}
-    for run_response in response_generator:
-        event_counts[run_response.event] = event_counts.get(run_response.event, 0) + 1
+    event_counts = Counter(run_response.event for run_response in response_generator)
 
     assert event_counts.keys() == {TeamRunEvent.run_content}
 
@@ -41,18 +182,17 @@ async def test_async_basic_events():
         members=[],
         telemetry=False,
     )
-    event_counts = {}
-    async for run_response in team.arun("Hello, how are you?", stream=True, stream_events=False):
-        event_counts[run_response.event] = event_counts.get(run_response.event, 0) + 1
+    event_counts = await acount_events(team.arun("Hello, how are you?", stream=True, stream_events=False))
 
     assert event_counts.keys() == {TeamRunEvent.run_content}
 
     assert event_counts[TeamRunEvent.run_content] > 1
 
 
-def test_basic_intermediate_steps_events(shared_db):
+@shared_db_group
+def test_basic_intermediate_steps_events(shared_db, gpt4o_mini):
     team = Team(
-        model=OpenAIChat(id="gpt-4o-mini"),
+        model=gpt4o_mini,
         members=[],
         db=shared_db,
         store_events=True,
@@ -61,35 +201,25 @@ def test_basic_intermediate_steps_events(shared_db):
 
     response_generator = team.run("Hello, how are you?", stream=True, stream_events=True)
 
-    events = {}
-    for run_response_delta in response_generator:
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    counts, first = tally_events(response_generator)
 
-    assert events.keys() == {
-        TeamRunEvent.run_started,
-        TeamRunEvent.model_request_started,
-        TeamRunEvent.model_request_completed,
-        TeamRunEvent.run_content,
-        TeamRunEvent.run_content_completed,
-        TeamRunEvent.run_completed,
-    }
+    assert counts.keys() == BASIC_EVENTS
 
-    assert len(events[TeamRunEvent.run_started]) == 1
-    assert events[TeamRunEvent.run_started][0].model == "gpt-4o-mini"
-    assert events[TeamRunEvent.run_started][0].model_provider == "OpenAI"
-    assert events[TeamRunEvent.run_started][0].session_id is not None
-    assert events[TeamRunEvent.run_started][0].team_id is not None
-    assert events[TeamRunEvent.run_started][0].run_id is not None
-    assert events[TeamRunEvent.run_started][0].created_at is not None
-    assert len(events[TeamRunEvent.run_content]) > 1
-    assert len(events[TeamRunEvent.run_content_completed]) == 1
-    assert len(events[TeamRunEvent.run_completed]) == 1
+    assert counts[TeamRunEvent.run_started] == 1
+    started = first[TeamRunEvent.run_started]
+    assert started.model == "gpt-4o-mini"
+    assert started.model_provider == "OpenAI"
+    assert started.session_id is not None
+    assert started.team_id is not None
+    assert started.run_id is not None
+    assert started.created_at is not None
+    assert counts[TeamRunEvent.run_content] > 1
+    assert counts[TeamRunEvent.run_content_completed] == 1
+    assert counts[TeamRunEvent.run_completed] == 1
 
-    team_completed_event = events[TeamRunEvent.run_completed][0]
-    assert hasattr(team_completed_event, "metadata")
-    assert hasattr(team_completed_event, "metrics")
+    team_completed_event = first[TeamRunEvent.run_completed]
+    # The dataclass declares metadata and metrics, no need to probe for them
+    assert isinstance(team_completed_event, TeamRunCompletedEvent)
 
     assert team_completed_event.metrics is not None
     assert team_completed_event.metrics.total_tokens > 0
@@ -108,39 +238,26 @@ def test_basic_intermediate_steps_events(shared_db):
     assert run_response_from_storage.events[4].event == TeamRunEvent.run_completed
 
     persisted_team_completed_event = run_response_from_storage.events[4]
-    assert hasattr(persisted_team_completed_event, "metadata")
-    assert hasattr(persisted_team_completed_event, "metrics")
+    assert isinstance(persisted_team_completed_event, TeamRunCompletedEvent)
 
     assert persisted_team_completed_event.metrics is not None
     assert persisted_team_completed_event.metrics.total_tokens > 0
 
 
-def test_intermediate_steps_with_tools(shared_db):
+@shared_db_group
+def test_intermediate_steps_with_tools(shared_db, o3_mini, yfinance_tools):
     team = Team(
-        model=OpenAIChat(id="o3-mini"),
+        model=o3_mini,
         members=[],
-        tools=[YFinanceTools(cache_results=True)],
+        tools=[yfinance_tools],
         db=shared_db,
         store_events=True,
         telemetry=False,
     )
 
-    events = {}
-    for run_response_delta in team.run("What is the stock price of Apple?", stream=True, stream_events=True):
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    events = collect_events(team.run("What is the stock price of Apple?", stream=True, stream_events=True))
 
-    assert events.keys() == {
-        TeamRunEvent.run_started,
-        TeamRunEvent.model_request_started,
-        TeamRunEvent.model_request_completed,
-        TeamRunEvent.tool_call_started,
-        TeamRunEvent.tool_call_completed,
-        TeamRunEvent.run_content,
-        TeamRunEvent.run_content_completed,
-        TeamRunEvent.run_completed,
-    }
+    assert events.keys() == TOOL_EVENTS
 
     assert len(events[TeamRunEvent.tool_call_started]) >= 1
     # The team may first try to delegate the task to a member, then call the tool directly
@@ -166,69 +283,51 @@ def test_intermediate_steps_with_tools(shared_db):
     assert TeamRunEvent.run_completed in event_types
 
 
-def test_intermediate_steps_with_reasoning():
+def test_intermediate_steps_with_reasoning(replay_stream, gpt4o_mini, reasoning_tools):
     team = Team(
-        model=OpenAIChat(id="gpt-4o-mini"),
+        model=gpt4o_mini,
         members=[],
-        tools=[ReasoningTools(add_instructions=True)],
-        instructions=dedent("""\
-            You are an expert problem-solving assistant with strong analytical skills! 🧠
-            Use step-by-step reasoning to solve the problem.
-            \
-        """),
+        tools=[reasoning_tools],
+        instructions=REASONING_INSTRUCTIONS,
         telemetry=False,
     )
 
-    response_generator = team.run(
+    response_generator = replay_stream(
+        team,
         "What is the sum of the first 10 natural numbers?",
-        stream=True,
         stream_events=True,
     )
 
-    events = {}
-    for run_response_delta in response_generator:
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    counts, first = tally_events(response_generator)
 
-    assert events.keys() == {
-        TeamRunEvent.run_started,
-        TeamRunEvent.model_request_started,
-        TeamRunEvent.model_request_completed,
-        TeamRunEvent.tool_call_started,
-        TeamRunEvent.tool_call_completed,
-        TeamRunEvent.reasoning_started,
-        TeamRunEvent.reasoning_completed,
-        TeamRunEvent.reasoning_step,
-        TeamRunEvent.run_content,
-        TeamRunEvent.run_content_completed,
-        TeamRunEvent.run_completed,
-    }
+    assert counts.keys() == REASONING_EVENTS
 
-    assert len(events[TeamRunEvent.run_started]) == 1
-    assert len(events[TeamRunEvent.run_content]) > 1
-    assert len(events[TeamRunEvent.run_content_completed]) == 1
-    assert len(events[TeamRunEvent.run_completed]) == 1
-    assert len(events[TeamRunEvent.tool_call_started]) > 1
-    assert len(events[TeamRunEvent.tool_call_completed]) > 1
-    assert len(events[TeamRunEvent.reasoning_started]) == 1
-    assert len(events[TeamRunEvent.reasoning_completed]) == 1
-    assert events[TeamRunEvent.reasoning_completed][0].content is not None
-    assert events[TeamRunEvent.reasoning_completed][0].content_type == "ReasoningSteps"
-    assert len(events[TeamRunEvent.reasoning_step]) > 1
-    assert events[TeamRunEvent.reasoning_step][0].content is not None
-    assert events[TeamRunEvent.reasoning_step][0].content_type == "ReasoningStep"
-    assert events[TeamRunEvent.reasoning_step][0].reasoning_content is not None
+    assert counts[TeamRunEvent.run_started] == 1
+    assert counts[TeamRunEvent.run_content] > 1
+    assert counts[TeamRunEvent.run_content_completed] == 1
+    assert counts[TeamRunEvent.run_completed] == 1
+    assert counts[TeamRunEvent.tool_call_started] > 1
+    assert counts[TeamRunEvent.tool_call_completed] > 1
+    assert counts[TeamRunEvent.reasoning_started] == 1
+    assert counts[TeamRunEvent.reasoning_completed] == 1
+    reasoning_completed = first[TeamRunEvent.reasoning_completed]
+    assert reasoning_completed.content is not None
+    assert reasoning_completed.content_type == "ReasoningSteps"
+    assert counts[TeamRunEvent.reasoning_step] > 1
+    reasoning_step = first[TeamRunEvent.reasoning_step]
+    assert reasoning_step.content is not None
+    assert reasoning_step.content_type == "ReasoningStep"
+    assert reasoning_step.reasoning_content is not None
 
 
 @pytest.mark.skip(reason="Not yet implemented")
-def test_intermediate_steps_with_user_confirmation():
+def test_intermediate_steps_with_user_confirmation(gpt4o_mini):
     @tool(requires_confirmation=True)
     def get_the_weather(city: str):
         return f"It is currently 70 degrees and cloudy in {city}"
 
     team = Team(
-        model=OpenAIChat(id="gpt-4o-mini"),
+        model=gpt4o_mini,
         members=[],
         tools=[get_the_weather],
         telemetry=False,
@@ -237,11 +336,7 @@ def test_intermediate_steps_with_user_confirmation():
     response_generator = team.run("What is the weather in Tokyo?", stream=True, stream_events=True)
 
     # First until we hit a pause
-    events = {}
-    for run_response_delta in response_generator:
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    events = collect_events(response_generator)
 
     assert events.keys() == {TeamRunEvent.run_started, TeamRunEvent.run_paused}
 
@@ -261,11 +356,7 @@ def test_intermediate_steps_with_user_confirmation():
     # Then we continue the run
     response_generator = team.continue_run(run_id=run_id, updated_tools=updated_tools, stream=True, stream_events=True)
 
-    events = {}
-    for run_response_delta in response_generator:
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    events = collect_events(response_generator)
 
     assert team.run_response.tools[0].result == "It is currently 70 degrees and cloudy in Tokyo"
 
@@ -289,9 +380,10 @@ def test_intermediate_steps_with_user_confirmation():
     assert team.run_response.is_paused is False
 
 
-def test_intermediate_steps_with_memory(shared_db):
+@shared_db_group
+def test_intermediate_steps_with_memory(shared_db, gpt4o_mini):
     team = Team(
-        model=OpenAIChat(id="gpt-4o-mini"),
+        model=gpt4o_mini,
         members=[],
         db=shared_db,
         update_memory_on_run=True,
@@ -300,34 +392,22 @@ def test_intermediate_steps_with_memory(shared_db):
 
     response_generator = team.run("Hello, how are you?", stream=True, stream_events=True)
 
-    events = {}
-    for run_response_delta in response_generator:
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    counts, _ = tally_events(response_generator)
 
-    assert events.keys() == {
-        TeamRunEvent.run_started,
-        TeamRunEvent.model_request_started,
-        TeamRunEvent.model_request_completed,
-        TeamRunEvent.run_content,
-        TeamRunEvent.run_content_completed,
-        TeamRunEvent.run_completed,
-        TeamRunEvent.memory_update_started,
-        TeamRunEvent.memory_update_completed,
-    }
+    assert counts.keys() == MEMORY_EVENTS
 
-    assert len(events[TeamRunEvent.run_started]) == 1
-    assert len(events[TeamRunEvent.run_content]) > 1
-    assert len(events[TeamRunEvent.run_content_completed]) == 1
-    assert len(events[TeamRunEvent.run_completed]) == 1
-    assert len(events[TeamRunEvent.memory_update_started]) == 1
-    assert len(events[TeamRunEvent.memory_update_completed]) == 1
+    assert counts[TeamRunEvent.run_started] == 1
+    assert counts[TeamRunEvent.run_content] > 1
+    assert counts[TeamRunEvent.run_content_completed] == 1
+    assert counts[TeamRunEvent.run_completed] == 1
+    assert counts[TeamRunEvent.memory_update_started] == 1
+    assert counts[TeamRunEvent.memory_update_completed] == 1
 
 
-def test_intermediate_steps_with_session_summary(shared_db):
+@shared_db_group
+def test_intermediate_steps_with_session_summary(shared_db, gpt4o_mini):
     team = Team(
-        model=OpenAIChat(id="gpt-4o-mini"),
+        model=gpt4o_mini,
         members=[],
         db=shared_db,
         enable_session_summaries=True,
@@ -336,32 +416,20 @@ def test_intermediate_steps_with_session_summary(shared_db):
 
     response_generator = team.run("Hello, how are you?", stream=True, stream_events=True)
 
-    events = {}
-    for run_response_delta in response_generator:
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    counts, _ = tally_events(response_generator)
 
-    assert events.keys() == {
-        TeamRunEvent.run_started,
-        TeamRunEvent.model_request_started,
-        TeamRunEvent.model_request_completed,
-        TeamRunEvent.run_content,
-        TeamRunEvent.run_content_completed,
-        TeamRunEvent.run_completed,
-        TeamRunEvent.session_summary_started,
-        TeamRunEvent.session_summary_completed,
-    }
+    assert counts.keys() == SESSION_SUMMARY_EVENTS
 
-    assert len(events[TeamRunEvent.run_started]) == 1
-    assert len(events[TeamRunEvent.run_content]) > 1
-    assert len(events[TeamRunEvent.run_content_completed]) == 1
-    assert len(events[TeamRunEvent.run_completed]) == 1
-    assert len(events[TeamRunEvent.session_summary_started]) == 1
-    assert len(events[TeamRunEvent.session_summary_completed]) == 1
+    assert counts[TeamRunEvent.run_started] == 1
+    assert counts[TeamRunEvent.run_content] > 1
+    assert counts[TeamRunEvent.run_content_completed] == 1
+    assert counts[TeamRunEvent.run_completed] == 1
+    assert counts[TeamRunEvent.session_summary_started] == 1
+    assert counts[TeamRunEvent.session_summary_completed] == 1
 
 
-def test_pre_hook_events_are_emitted(shared_db):
+@shared_db_group
+def test_pre_hook_events_are_emitted(shared_db, gpt4o_mini):
     """Test that the agent streams events."""
 
     def pre_hook_1(run_input: TeamRunInput) -> None:
@@ -371,7 +439,7 @@ def test_pre_hook_events_are_emitted(shared_db):
         run_input.input_content += " (Modified by pre-hook 2)"
 
     team = Team(
-        model=OpenAIChat(id="gpt-4o-mini"),
+        model=gpt4o_mini,
         members=[],
         pre_hooks=[pre_hook_1, pre_hook_2],
         db=shared_db,
@@ -380,22 +448,9 @@ def test_pre_hook_events_are_emitted(shared_db):
 
     response_generator = team.run("Hello, how are you?", stream=True, stream_events=True)
 
-    events = {}
-    for run_response_delta in response_generator:
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    events = collect_events(response_generator)
 
-    assert events.keys() == {
-        TeamRunEvent.run_started,
-        TeamRunEvent.model_request_started,
-        TeamRunEvent.model_request_completed,
-        TeamRunEvent.pre_hook_started,
-        TeamRunEvent.pre_hook_completed,
-        TeamRunEvent.run_content,
-        TeamRunEvent.run_content_completed,
-        TeamRunEvent.run_completed,
-    }
+    assert events.keys() == PRE_HOOK_EVENTS
 
     assert len(events[TeamRunEvent.run_started]) == 1
     assert len(events[TeamRunEvent.run_content]) > 1
@@ -423,6 +478,7 @@ def test_pre_hook_events_are_emitted(shared_db):
 
 
 @pytest.mark.asyncio
+@shared_db_group
 async def test_async_pre_hook_events_are_emitted(shared_db):
     """Test that the agent streams events."""
 
@@ -442,22 +498,9 @@ async def test_async_pre_hook_events_are_emitted(shared_db):
 
     response_generator = team.arun("Hello, how are you?", stream=True, stream_events=True)
 
-    events = {}
-    async for run_response_delta in response_generator:
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    events = await acollect_events(response_generator)
 
-    assert events.keys() == {
-        TeamRunEvent.run_started,
-        TeamRunEvent.model_request_started,
-        TeamRunEvent.model_request_completed,
-        TeamRunEvent.pre_hook_started,
-        TeamRunEvent.pre_hook_completed,
-        TeamRunEvent.run_content,
-        TeamRunEvent.run_content_completed,
-        TeamRunEvent.run_completed,
-    }
+    assert events.keys() == PRE_HOOK_EVENTS
 
     assert len(events[TeamRunEvent.run_started]) == 1
     assert len(events[TeamRunEvent.run_content]) > 1
@@ -484,7 +527,8 @@ async def test_async_pre_hook_events_are_emitted(shared_db):
     )
 
 
-def test_post_hook_events_are_emitted(shared_db):
+@shared_db_group
+def test_post_hook_events_are_emitted(shared_db, gpt4o_mini):
     """Test that post hook events are emitted correctly during streaming."""
 
     def post_hook_1(run_output: TeamRunOutput) -> None:
@@ -494,7 +538,7 @@ def test_post_hook_events_are_emitted(shared_db):
         run_output.content = str(run_output.content) + " (Modified by post-hook 2)"
 
     team = Team(
-        model=OpenAIChat(id="gpt-4o-mini"),
+        model=gpt4o_mini,
         members=[],
         post_hooks=[post_hook_1, post_hook_2],
         db=shared_db,
@@ -503,22 +547,9 @@ def test_post_hook_events_are_emitted(shared_db):
 
     response_generator = team.run("Hello, how are you?", stream=True, stream_events=True)
 
-    events = {}
-    for run_response_delta in response_generator:
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    events = collect_events(response_generator)
 
-    assert events.keys() == {
-        TeamRunEvent.run_started,
-        TeamRunEvent.model_request_started,
-        TeamRunEvent.model_request_completed,
-        TeamRunEvent.run_content,
-        TeamRunEvent.run_content_completed,
-        TeamRunEvent.post_hook_started,
-        TeamRunEvent.post_hook_completed,
-        TeamRunEvent.run_completed,
-    }
+    assert events.keys() == POST_HOOK_EVENTS
 
     assert len(events[TeamRunEvent.run_started]) == 1
     assert len(events[TeamRunEvent.run_content]) > 1
@@ -542,6 +573,7 @@ def test_post_hook_events_are_emitted(shared_db):
 
 
 @pytest.mark.asyncio
+@shared_db_group
 async def test_async_post_hook_events_are_emitted(shared_db):
     """Test that async post hook events are emitted correctly during streaming."""
 
@@ -561,22 +593,9 @@ async def test_async_post_hook_events_are_emitted(shared_db):
 
     response_generator = team.arun("Hello, how are you?", stream=True, stream_events=True)
 
-    events = {}
-    async for run_response_delta in response_generator:
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    events = await acollect_events(response_generator)
 
-    assert events.keys() == {
-        TeamRunEvent.run_started,
-        TeamRunEvent.model_request_started,
-        TeamRunEvent.model_request_completed,
-        TeamRunEvent.run_content,
-        TeamRunEvent.run_content_completed,
-        TeamRunEvent.post_hook_started,
-        TeamRunEvent.post_hook_completed,
-        TeamRunEvent.run_completed,
-    }
+    assert events.keys() == POST_HOOK_EVENTS
 
     assert len(events[TeamRunEvent.run_started]) == 1
     assert len(events[TeamRunEvent.run_content]) > 1
@@ -599,7 +618,8 @@ async def test_async_post_hook_events_are_emitted(shared_db):
     assert "(Modified by async post-hook 2)" in str(final_event.content)
 
 
-def test_pre_and_post_hook_events_are_emitted(shared_db):
+@shared_db_group
+def test_pre_and_post_hook_events_are_emitted(shared_db, gpt4o_mini):
     """Test that both pre and post hook events are emitted correctly during streaming."""
 
     def pre_hook(run_input: TeamRunInput) -> None:
@@ -609,7 +629,7 @@ def test_pre_and_post_hook_events_are_emitted(shared_db):
         run_output.content = str(run_output.content) + " (Modified by post-hook)"
 
     team = Team(
-        model=OpenAIChat(id="gpt-4o-mini"),
+        model=gpt4o_mini,
         members=[],
         pre_hooks=[pre_hook],
         post_hooks=[post_hook],
@@ -619,24 +639,9 @@ def test_pre_and_post_hook_events_are_emitted(shared_db):
 
     response_generator = team.run("Hello", stream=True, stream_events=True)
 
-    events = {}
-    for run_response_delta in response_generator:
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    events = collect_events(response_generator)
 
-    assert events.keys() == {
-        TeamRunEvent.run_started,
-        TeamRunEvent.model_request_started,
-        TeamRunEvent.model_request_completed,
-        TeamRunEvent.pre_hook_started,
-        TeamRunEvent.pre_hook_completed,
-        TeamRunEvent.run_content,
-        TeamRunEvent.run_content_completed,
-        TeamRunEvent.post_hook_started,
-        TeamRunEvent.post_hook_completed,
-        TeamRunEvent.run_completed,
-    }
+    assert events.keys() == PRE_AND_POST_HOOK_EVENTS
 
     # Verify pre hook events
     assert len(events[TeamRunEvent.pre_hook_started]) == 1
@@ -655,7 +660,8 @@ def test_pre_and_post_hook_events_are_emitted(shared_db):
     assert "(Modified by post-hook)" in str(final_event.content)
 
 
-def test_intermediate_steps_with_structured_output(shared_db):
+@shared_db_group
+def test_intermediate_steps_with_structured_output(shared_db, gpt4o_mini):
     """Test that the agent streams events."""
 
     class Person(BaseModel):
@@ -664,7 +670,7 @@ def test_intermediate_steps_with_structured_output(shared_db):
         age: int
 
     team = Team(
-        model=OpenAIChat(id="gpt-4o-mini"),
+        model=gpt4o_mini,
         members=[],
         db=shared_db,
         output_schema=Person,
@@ -674,42 +680,32 @@ def test_intermediate_steps_with_structured_output(shared_db):
 
     response_generator = team.run("Describe Elon Musk", stream=True, stream_events=True)
 
-    events = {}
-    for run_response_delta in response_generator:
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    counts, first = tally_events(response_generator)
 
-    assert events.keys() == {
-        TeamRunEvent.run_started,
-        TeamRunEvent.model_request_started,
-        TeamRunEvent.model_request_completed,
-        TeamRunEvent.run_content,
-        TeamRunEvent.run_content_completed,
-        TeamRunEvent.run_completed,
-    }
+    assert counts.keys() == BASIC_EVENTS
 
-    assert len(events[TeamRunEvent.run_started]) == 1
-    assert len(events[TeamRunEvent.run_content]) == 1
-    assert len(events[TeamRunEvent.run_content_completed]) == 1
-    assert len(events[TeamRunEvent.run_completed]) == 1
+    assert counts[TeamRunEvent.run_started] == 1
+    assert counts[TeamRunEvent.run_content] == 1
+    assert counts[TeamRunEvent.run_content_completed] == 1
+    assert counts[TeamRunEvent.run_completed] == 1
 
-    assert events[TeamRunEvent.run_content][0].content is not None
-    assert events[TeamRunEvent.run_content][0].content_type == "Person"
-    assert events[TeamRunEvent.run_content][0].content.name == "Elon Musk"
-    assert len(events[TeamRunEvent.run_content][0].content.description) > 1
+    assert first[TeamRunEvent.run_content].content is not None
+    assert first[TeamRunEvent.run_content].content_type == "Person"
+    assert first[TeamRunEvent.run_content].content.name == "Elon Musk"
+    assert len(first[TeamRunEvent.run_content].content.description) > 1
 
-    assert events[TeamRunEvent.run_completed][0].content is not None
-    assert events[TeamRunEvent.run_completed][0].content_type == "Person"
-    assert events[TeamRunEvent.run_completed][0].content.name == "Elon Musk"
-    assert len(events[TeamRunEvent.run_completed][0].content.description) > 1
+    assert first[TeamRunEvent.run_completed].content is not None
+    assert first[TeamRunEvent.run_completed].content_type == "Person"
+    assert first[TeamRunEvent.run_completed].content.name == "Elon Musk"
+    assert len(first[TeamRunEvent.run_completed].content.description) > 1
 
-    team_completed_event_structured = events[TeamRunEvent.run_completed][0]
+    team_completed_event_structured = first[TeamRunEvent.run_completed]
     assert team_completed_event_structured.metrics is not None
     assert team_completed_event_structured.metrics.total_tokens > 0
 
 
-def test_intermediate_steps_with_parser_model(shared_db):
+@shared_db_group
+def test_intermediate_steps_with_parser_model(shared_db, gpt4o_mini):
     """Test that the agent streams events."""
 
     class Person(BaseModel):
@@ -718,7 +714,7 @@ def test_intermediate_steps_with_parser_model(shared_db):
         age: int
 
     team = Team(
-        model=OpenAIChat(id="gpt-4o-mini"),
+        model=gpt4o_mini,
         members=[],
         db=shared_db,
         output_schema=Person,
@@ -729,24 +725,11 @@ def test_intermediate_steps_with_parser_model(shared_db):
 
     response_generator = team.run("Describe Elon Musk", stream=True, stream_events=True)
 
-    events = {}
-    for run_response_delta in response_generator:
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    events = collect_events(response_generator)
 
     run_response = team.get_last_run_output()
 
-    assert events.keys() == {
-        TeamRunEvent.run_started,
-        TeamRunEvent.model_request_started,
-        TeamRunEvent.model_request_completed,
-        TeamRunEvent.parser_model_response_started,
-        TeamRunEvent.parser_model_response_completed,
-        TeamRunEvent.run_content,
-        TeamRunEvent.run_content_completed,
-        TeamRunEvent.run_completed,
-    }
+    assert events.keys() == PARSER_MODEL_EVENTS
 
     assert len(events[TeamRunEvent.run_started]) == 1
     assert len(events[TeamRunEvent.parser_model_response_started]) == 1
@@ -791,77 +774,57 @@ def test_intermediate_steps_with_parser_model(shared_db):
         assert len(response_content.description) > 1
 
 
-def test_intermediate_steps_with_member_agents():
+def test_intermediate_steps_with_member_agents(replay_stream, gpt4o_mini, calculator_tools, reasoning_tools):
     agent_1 = Agent(
         name="Analyst",
         model=OpenAIChat(id="gpt-4o-mini"),
         instructions="You are an expert problem-solving assistant with strong analytical skills! 🧠",
-        tools=[ReasoningTools(add_instructions=True)],
+        tools=[reasoning_tools],
     )
     agent_2 = Agent(
         name="Math Agent",
         model=OpenAIChat(id="gpt-4o-mini"),
         instructions="You can do Math!",
-        tools=[CalculatorTools()],
+        tools=[calculator_tools],
     )
     team = Team(
-        model=OpenAIChat(id="gpt-4o-mini"),
+        model=gpt4o_mini,
         members=[agent_1, agent_2],
         telemetry=False,
     )
 
-    response_generator = team.run(
-        "Analyse and then solve the problem: 'solve 10 factorial'", stream=True, stream_events=True
+    response_generator = replay_stream(
+        team, "Analyse and then solve the problem: 'solve 10 factorial'", stream_events=True
     )
 
-    events = {}
-    for run_response_delta in response_generator:
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    events = collect_events(response_generator)
 
-    # Core events that must always be present when delegation happens
-    required_events = {
-        TeamRunEvent.run_started,
-        TeamRunEvent.model_request_started,
-        TeamRunEvent.model_request_completed,
-        TeamRunEvent.tool_call_started,
-        TeamRunEvent.tool_call_completed,
-        RunEvent.run_started,
-        RunEvent.model_request_started,
-        RunEvent.model_request_completed,
-        RunEvent.tool_call_started,
-        RunEvent.tool_call_completed,
-        RunEvent.run_content_completed,
-        RunEvent.run_completed,
-        TeamRunEvent.run_content,
-        TeamRunEvent.run_content_completed,
-        TeamRunEvent.run_completed,
-    }
-    assert required_events.issubset(events.keys()), f"Missing required events: {required_events - events.keys()}"
+    assert MEMBER_DELEGATION_EVENTS.issubset(events.keys()), (
+        f"Missing required events: {MEMBER_DELEGATION_EVENTS - events.keys()}"
+    )
 
     assert len(events[TeamRunEvent.run_started]) == 1
     # Transfer twice, from team to member agents
     assert len(events[TeamRunEvent.tool_call_started]) == 2
-    assert events[TeamRunEvent.tool_call_started][0].tool.tool_name == "delegate_task_to_member"
-    assert events[TeamRunEvent.tool_call_started][0].tool.tool_args["member_id"] == "analyst"
-    assert events[TeamRunEvent.tool_call_started][1].tool.tool_name == "delegate_task_to_member"
-    assert events[TeamRunEvent.tool_call_started][1].tool.tool_args["member_id"] == "math-agent"
+    to_analyst, to_math_agent = (event.tool for event in events[TeamRunEvent.tool_call_started])
+    assert to_analyst.tool_name == "delegate_task_to_member"
+    assert to_analyst.tool_args["member_id"] == "analyst"
+    assert to_math_agent.tool_name == "delegate_task_to_member"
+    assert to_math_agent.tool_args["member_id"] == "math-agent"
     assert len(events[TeamRunEvent.tool_call_completed]) == 2
-    assert events[TeamRunEvent.tool_call_completed][0].tool.tool_name == "delegate_task_to_member"
-    assert events[TeamRunEvent.tool_call_completed][0].tool.result is not None
-    assert events[TeamRunEvent.tool_call_completed][1].tool.tool_name == "delegate_task_to_member"
-    assert events[TeamRunEvent.tool_call_completed][1].tool.result is not None
+    for completed in events[TeamRunEvent.tool_call_completed]:
+        assert completed.tool.tool_name == "delegate_task_to_member"
+        assert completed.tool.result is not None
     assert len(events[TeamRunEvent.run_content]) > 1
     assert len(events[TeamRunEvent.run_content_completed]) == 1
     assert len(events[TeamRunEvent.run_completed]) == 1
     # Two member agents
     assert len(events[RunEvent.run_started]) == 2
-    assert events[RunEvent.run_started][0].parent_run_id == events[TeamRunEvent.run_started][0].run_id
-    assert events[RunEvent.run_started][1].parent_run_id == events[TeamRunEvent.run_started][0].run_id
+    team_run_id = events[TeamRunEvent.run_started][0].run_id
+    assert all(event.parent_run_id == team_run_id for event in events[RunEvent.run_started])
     assert len(events[RunEvent.run_completed]) == 2
-    assert events[RunEvent.run_completed][0].parent_run_id == events[TeamRunEvent.run_completed][0].run_id
-    assert events[RunEvent.run_completed][1].parent_run_id == events[TeamRunEvent.run_completed][0].run_id
+    completed_run_id = events[TeamRunEvent.run_completed][0].run_id
+    assert all(event.parent_run_id == completed_run_id for event in events[RunEvent.run_completed])
     # Lots of member tool calls
     assert len(events[RunEvent.tool_call_started]) > 1
     assert len(events[RunEvent.tool_call_completed]) > 1
@@ -876,94 +839,78 @@ def test_intermediate_steps_with_member_agents():
     assert len(events[RunEvent.run_content_completed]) >= 1
 
 
-def test_intermediate_steps_with_member_agents_only_member_events():
+def test_intermediate_steps_with_member_agents_only_member_events(replay_stream, gpt4o_mini, calculator_tools):
     agent_math = Agent(
         name="Math Agent",
         model=OpenAIChat(id="gpt-4o-mini"),
         instructions="You can do Math!",
-        tools=[CalculatorTools()],
+        tools=[calculator_tools],
     )
     team = Team(
-        model=OpenAIChat(id="gpt-4o-mini"),
+        model=gpt4o_mini,
         members=[agent_math],
         telemetry=False,
         stream_member_events=True,
     )
 
-    response_generator = team.run(
+    response_generator = replay_stream(
+        team,
         "Analyse and then solve the problem: 'solve 10 factorial'",
-        stream=True,
         stream_events=False,  # stream_events=False to only stream member events
     )
 
-    events = {}
-    for run_response_delta in response_generator:
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    counts, first = tally_events(response_generator)
 
-    required_events = {
-        RunEvent.run_started,
-        RunEvent.model_request_started,
-        RunEvent.model_request_completed,
-        RunEvent.tool_call_started,
-        RunEvent.tool_call_completed,
-        RunEvent.run_content_completed,
-        RunEvent.run_completed,
-        TeamRunEvent.run_content,
-    }
-    assert required_events.issubset(events.keys()), f"Missing required events: {required_events - events.keys()}"
+    assert MEMBER_ONLY_EVENTS.issubset(counts.keys()), f"Missing required events: {MEMBER_ONLY_EVENTS - counts.keys()}"
 
     # Agent content restreamed as team content
-    assert len(events[TeamRunEvent.run_content]) > 1
+    assert counts[TeamRunEvent.run_content] > 1
 
-    assert len(events[RunEvent.run_started]) == 1
-    assert len(events[RunEvent.tool_call_started]) == 1
-    assert len(events[RunEvent.tool_call_completed]) == 1
-    assert len(events[RunEvent.run_content_completed]) == 1
-    assert len(events[RunEvent.run_completed]) == 1
+    assert counts[RunEvent.run_started] == 1
+    assert counts[RunEvent.tool_call_started] == 1
+    assert counts[RunEvent.tool_call_completed] == 1
+    assert counts[RunEvent.run_content_completed] == 1
+    assert counts[RunEvent.run_completed] == 1
     # Member agent events should reference the team run
-    assert len(events[RunEvent.run_started]) == 1
-    assert events[RunEvent.run_started][0].parent_run_id == events[TeamRunEvent.run_content][0].run_id
-    assert len(events[RunEvent.run_completed]) == 1
-    assert events[RunEvent.run_completed][0].parent_run_id == events[TeamRunEvent.run_content][0].run_id
+    assert counts[RunEvent.run_started] == 1
+    assert first[RunEvent.run_started].parent_run_id == first[TeamRunEvent.run_content].run_id
+    assert counts[RunEvent.run_completed] == 1
+    assert first[RunEvent.run_completed].parent_run_id == first[TeamRunEvent.run_content].run_id
     # Member tool calls
-    assert len(events[RunEvent.tool_call_started]) == 1
-    assert len(events[RunEvent.tool_call_completed]) == 1
+    assert counts[RunEvent.tool_call_started] == 1
+    assert counts[RunEvent.tool_call_completed] == 1
     # IntermediateRunContent is optional (depends on whether agent streams content during execution)
-    if TeamRunEvent.run_intermediate_content in events:
-        assert len(events[TeamRunEvent.run_intermediate_content]) > 1
-    assert len(events[RunEvent.run_content_completed]) == 1
+    if TeamRunEvent.run_intermediate_content in counts:
+        assert counts[TeamRunEvent.run_intermediate_content] > 1
+    assert counts[RunEvent.run_content_completed] == 1
 
 
-def test_intermediate_steps_with_member_agents_nested_team():
+def test_intermediate_steps_with_member_agents_nested_team(
+    replay_stream, gpt4o_mini, reasoning_tools, websearch_tools, yfinance_tools
+):
     agent_1 = Agent(
         name="Finance Analyst",
         model=OpenAIChat(id="gpt-4o-mini"),
         instructions="You are an expert finance analyst with strong analytical skills! 🧠",
-        tools=[YFinanceTools(cache_results=True)],
+        tools=[yfinance_tools],
     )
     sub_team = Team(
         model=OpenAIChat(id="gpt-4o-mini"),
         name="News Team",
         members=[],
-        tools=[WebSearchTools(cache_results=True)],
+        tools=[websearch_tools],
         telemetry=False,
     )
     team = Team(
-        model=OpenAIChat(id="gpt-4o-mini"),
+        model=gpt4o_mini,
         members=[agent_1, sub_team],
-        tools=[ReasoningTools(add_instructions=True)],
+        tools=[reasoning_tools],
         telemetry=False,
     )
 
-    response_generator = team.run("Do a stock market analysis for Apple.", stream=True, stream_events=True)
+    response_generator = replay_stream(team, "Do a stock market analysis for Apple.", stream_events=True)
 
-    events = {}
-    for run_response_delta in response_generator:
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    events = collect_events(response_generator)
 
     # Core events that must always be present
     required_events = {
@@ -1018,64 +965,53 @@ def test_intermediate_steps_with_member_agents_nested_team():
     assert not unexpected_events, f"Unexpected events: {unexpected_events}"
 
 
-def test_intermediate_steps_with_member_agents_streaming_off():
+def test_intermediate_steps_with_member_agents_streaming_off(
+    replay_stream, gpt4o_mini, calculator_tools, reasoning_tools
+):
     agent_1 = Agent(
         name="Analyst",
         model=OpenAIChat(id="gpt-4o-mini"),
         instructions="You are an expert problem-solving assistant with strong analytical skills! 🧠",
-        tools=[ReasoningTools(add_instructions=True)],
+        tools=[reasoning_tools],
     )
     agent_2 = Agent(
         name="Math Agent",
         model=OpenAIChat(id="gpt-4o-mini"),
         instructions="You can do Math!",
-        tools=[CalculatorTools()],
+        tools=[calculator_tools],
     )
     team = Team(
-        model=OpenAIChat(id="gpt-4o-mini"),
+        model=gpt4o_mini,
         members=[agent_1, agent_2],
         telemetry=False,
         stream_member_events=False,
     )
 
-    response_generator = team.run(
-        "Analyse and then solve the problem: 'solve 10 factorial'", stream=True, stream_events=True
+    response_generator = replay_stream(
+        team, "Analyse and then solve the problem: 'solve 10 factorial'", stream_events=True
     )
 
-    events = {}
-    for run_response_delta in response_generator:
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    events = collect_events(response_generator)
 
-    assert events.keys() == {
-        TeamRunEvent.run_started,
-        TeamRunEvent.model_request_started,
-        TeamRunEvent.model_request_completed,
-        TeamRunEvent.tool_call_started,
-        TeamRunEvent.tool_call_completed,
-        TeamRunEvent.run_content,
-        TeamRunEvent.run_content_completed,
-        TeamRunEvent.run_completed,
-    }
+    assert events.keys() == TOOL_EVENTS
 
     assert len(events[TeamRunEvent.run_started]) == 1
     # Transfer twice, from team to member agents
     assert len(events[TeamRunEvent.tool_call_started]) == 2
-    assert events[TeamRunEvent.tool_call_started][0].tool.tool_name == "delegate_task_to_member"
-    assert events[TeamRunEvent.tool_call_started][0].tool.tool_args["member_id"] == "analyst"
-    assert events[TeamRunEvent.tool_call_started][1].tool.tool_name == "delegate_task_to_member"
-    assert events[TeamRunEvent.tool_call_started][1].tool.tool_args["member_id"] == "math-agent"
+    to_analyst, to_math_agent = (event.tool for event in events[TeamRunEvent.tool_call_started])
+    assert to_analyst.tool_name == "delegate_task_to_member"
+    assert to_analyst.tool_args["member_id"] == "analyst"
+    assert to_math_agent.tool_name == "delegate_task_to_member"
+    assert to_math_agent.tool_args["member_id"] == "math-agent"
     assert len(events[TeamRunEvent.tool_call_completed]) == 2
-    assert events[TeamRunEvent.tool_call_completed][0].tool.tool_name == "delegate_task_to_member"
-    assert events[TeamRunEvent.tool_call_completed][0].tool.result is not None
-    assert events[TeamRunEvent.tool_call_completed][1].tool.tool_name == "delegate_task_to_member"
-    assert events[TeamRunEvent.tool_call_completed][1].tool.result is not None
+    for completed in events[TeamRunEvent.tool_call_completed]:
+        assert completed.tool.tool_name == "delegate_task_to_member"
+        assert completed.tool.result is not None
     assert len(events[TeamRunEvent.run_content]) > 1
     assert len(events[TeamRunEvent.run_completed]) == 1
 
 
-def test_intermediate_steps_with_member_agents_delegate_to_all_members():
+def test_intermediate_steps_with_member_agents_delegate_to_all_members(replay_stream, o3_mini):
     def get_news_from_hackernews(query: str):
         return "The best way to learn to code is to use the Hackernews API."
 
@@ -1097,44 +1033,40 @@ def test_intermediate_steps_with_member_agents_delegate_to_all_members():
         stream_events=True,
     )
     team = Team(
-        model=OpenAIChat(id="o3-mini"),
+        model=o3_mini,
         members=[agent_1, agent_2],
         telemetry=False,
         delegate_to_all_members=True,
         instructions="You are a discussion master. Forward the task to the member agents.",
     )
 
-    response_generator = team.run(
+    response_generator = replay_stream(
+        team,
         input="Start the discussion on the topic: 'What is the best way to learn to code?'",
-        stream=True,
         stream_events=True,
     )
 
-    events = {}
-    for run_response_delta in response_generator:
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    counts, first = tally_events(response_generator)
 
-    assert len(events[TeamRunEvent.run_started]) == 1
+    assert counts[TeamRunEvent.run_started] == 1
 
     # Assert expected events from team
-    assert len(events[TeamRunEvent.tool_call_started]) == 1
-    assert len(events[TeamRunEvent.run_content]) > 1
-    assert len(events[TeamRunEvent.run_completed]) == 1
+    assert counts[TeamRunEvent.tool_call_started] == 1
+    assert counts[TeamRunEvent.run_content] > 1
+    assert counts[TeamRunEvent.run_completed] == 1
 
     # Assert expected tool call events
-    assert events[TeamRunEvent.tool_call_started][0].tool.tool_name == "delegate_task_to_members"
-    assert len(events[TeamRunEvent.tool_call_completed]) == 1
-    assert events[TeamRunEvent.tool_call_completed][0].tool.tool_name == "delegate_task_to_members"
-    assert events[TeamRunEvent.tool_call_completed][0].tool.result is not None
+    assert first[TeamRunEvent.tool_call_started].tool.tool_name == "delegate_task_to_members"
+    assert counts[TeamRunEvent.tool_call_completed] == 1
+    assert first[TeamRunEvent.tool_call_completed].tool.tool_name == "delegate_task_to_members"
+    assert first[TeamRunEvent.tool_call_completed].tool.result is not None
 
     # Assert expected events from members
-    assert len(events[RunEvent.run_started]) == 2
-    assert len(events[RunEvent.run_completed]) == 2
+    assert counts[RunEvent.run_started] == 2
+    assert counts[RunEvent.run_completed] == 2
     # IntermediateRunContent is optional (depends on whether agent streams content during execution)
-    if TeamRunEvent.run_intermediate_content in events:
-        assert len(events[TeamRunEvent.run_intermediate_content]) > 1
+    if TeamRunEvent.run_intermediate_content in counts:
+        assert counts[TeamRunEvent.run_intermediate_content] > 1
 
 
 def test_tool_parent_run_id():
@@ -1157,11 +1089,7 @@ def test_tool_parent_run_id():
         stream_events=True,
     )
 
-    events = {}
-    for run_response_delta in response_generator:
-        if run_response_delta.event not in events:
-            events[run_response_delta.event] = []
-        events[run_response_delta.event].append(run_response_delta)
+    events = collect_events(response_generator)
 
     assert len(events[TeamRunEvent.run_started]) == 1
     assert len(events[TeamRunEvent.run_completed]) == 1
@@ -102,3 +102,79 @@ class TestOpenAIEmbedderDimensions:
 
         call_kwargs = mock_client.embeddings.create.call_args[1]
         assert "dimensions" not in call_kwargs
+
+
+class TestOpenAIEmbedderBatch:
+    def test_batch_sends_one_request_per_batch(self):
+        from agno.knowledge.embedder.openai import OpenAIEmbedder
+
+        mock_response = MagicMock()
+        mock_response.data = [MagicMock(embedding=[0.1, 0.2]), MagicMock(embedding=[0.3, 0.4])]
+        mock_response.usage = None
+        mock_client = MagicMock()
+        mock_client.embeddings.create.return_value = mock_response
+
+        embedder = OpenAIEmbedder(batch_size=2)
+        embedder.openai_client = mock_client
+
+        embeddings, usages = embedder.get_embeddings_batch_and_usage(["a", "b", "c", "d"])
+
+        assert mock_client.embeddings.create.call_count == 2
+        assert mock_client.embeddings.create.call_args_list[0][1]["input"] == ["a", "b"]
+        assert embeddings == [[0.1, 0.2], [0.3, 0.4]] * 2
+        assert usages == [None] * 4
+
+    def test_batch_falls_back_to_individual_requests_on_error(self, _mock_openai_client):
+        mock_client, mock_response = _mock_openai_client
+
+        from agno.knowledge.embedder.openai import OpenAIEmbedder
+
+        mock_client.embeddings.create.side_effect = [Exception("batch failed"), mock_response, mock_response]
+        embedder = OpenAIEmbedder()
+        embedder.openai_client = mock_client
+
+        embeddings, usages = embedder.get_embeddings_batch_and_usage(["a", "b"])
+
+        assert mock_client.embeddings.create.call_count == 3
+        assert embeddings == [[0.1, 0.2, 0.3], [0.1, 0.2, 0.3]]
+        assert usages == [None, None]
+
+    def test_batch_reraises_rate_limit_error(self, _mock_openai_client):
+        import httpx
+        from openai import RateLimitError
+
+        from agno.knowledge.embedder.openai import OpenAIEmbedder
+
+        mock_client, _ = _mock_openai_client
+        request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+        mock_client.embeddings.create.side_effect = RateLimitError(
+            "Rate limit reached", response=httpx.Response(429, request=request), body=None
+        )
+        embedder = OpenAIEmbedder()
+        embedder.openai_client = mock_client
+
+        with pytest.raises(RateLimitError):
+            embedder.get_embeddings_batch_and_usage(["a", "b"])
+
+        # No per-text fallback requests after a rate limit
+        assert mock_client.embeddings.create.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_async_batch_reraises_rate_limit_error(self, _mock_async_openai_client):
+        import httpx
+        from openai import RateLimitError
+
+        from agno.knowledge.embedder.openai import OpenAIEmbedder
+
+        mock_client, _ = _mock_async_openai_client
+        request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+        mock_client.embeddings.create.side_effect = RateLimitError(
+            "Rate limit reached", response=httpx.Response(429, request=request), body=None
+        )
+        embedder = OpenAIEmbedder()
+        embedder.async_client = mock_client
+
+        with pytest.raises(RateLimitError):
+            await embedder.async_get_embeddings_batch_and_usage(["a", "b"])
+
+        assert mock_client.embeddings.create.call_count == 1
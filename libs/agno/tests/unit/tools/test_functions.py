@@ -6,7 +6,7 @@ from pydantic import BaseModel, ValidationError
 from agno.models.message import Message
 from agno.run.base import RunContext
 from agno.tools.decorator import tool
-from agno.tools.function import Function, FunctionCall
+from agno.tools.function import Function, FunctionCall, parse_docstring
 
 
 def test_function_initialization():
@@ -1213,3 +1213,25 @@ def test_tool_hook_receives_messages_via_run_context():
     # Verify it's a copy (not the same reference), so hook mutations don't affect the run
     assert captured_messages is not run_context.messages
     assert captured_messages == run_context.messages
+
+
+def test_docstring_parsing_is_memoized_across_functions():
+    """Building the same tool twice reuses the parsed docstring."""
+
+    def lookup(city: str) -> str:
+        """Look up a city.
+
+        Args:
+            city: The city to look up
+        """
+        return city
+
+    parse_docstring.cache_clear()
+    first = Function.from_callable(lookup)
+    first.process_entrypoint()
+    second = Function.from_callable(lookup)
+    second.process_entrypoint()
+
+    assert parse_docstring.cache_info().hits >= 1
+    assert first.parameters == second.parameters
+    assert second.parameters["properties"]["city"]["description"] == "The city to look up"
@@ -0,0 +1,20 @@
+from agno.run.team import RunContentEvent, RunStartedEvent, TeamRunEvent, TeamRunOutput
+from agno.utils.events import handle_event
+
+
+def test_handle_event_skips_configured_events():
+    run_response = TeamRunOutput(run_id="run-1")
+    events_to_skip = [TeamRunEvent.run_content]
+
+    handle_event(RunStartedEvent(run_id="run-1"), run_response, events_to_skip=events_to_skip, store_events=True)
+    handle_event(RunContentEvent(run_id="run-1"), run_response, events_to_skip=events_to_skip, store_events=True)
+
+    assert [event.event for event in run_response.events] == [TeamRunEvent.run_started.value]
+
+
+def test_handle_event_does_not_store_when_disabled():
+    run_response = TeamRunOutput(run_id="run-1")
+
+    event = RunStartedEvent(run_id="run-1")
+    assert handle_event(event, run_response, store_events=False) is event
+    assert run_response.events is None
@@ -1,5 +1,4 @@
-import os
-import shutil
+from hashlib import md5
 from typing import List
 from unittest.mock import MagicMock, patch
 
@@ -12,24 +11,26 @@ from agno.vectordb.distance import Distance
 from agno.vectordb.search import SearchType
 
 TEST_COLLECTION = "test_collection"
-TEST_PATH = "tmp/test_chromadb"
+
+
+def _content_id(content: str) -> str:
+    """MD5 of the null-byte-cleaned content, the base ChromaDb derives document IDs from."""
+    return md5(content.replace("\x00", "\ufffd").encode()).hexdigest()
+
+
+def _embed_documents(embedder, documents: List[Document]) -> None:
+    """Pre-set embeddings so the async insert paths skip embedding."""
+    for document in documents:
+        document.embedding = embedder.get_embedding(document.content)
 
 
 @pytest.fixture
-def chroma_db(mock_embedder, request):
+def chroma_db(mock_embedder, request, tmp_path):
     """Fixture to create and clean up a ChromaDb instance
 
     Can optionally accept batch_size via indirect parametrization:
         @pytest.mark.parametrize('chroma_db', [batch_size_value], indirect=True)
     """
-    # Ensure the test directory exists with proper permissions
-    os.makedirs(TEST_PATH, exist_ok=True)
-
-    # Clean up any existing data before the test
-    if os.path.exists(TEST_PATH):
-        shutil.rmtree(TEST_PATH)
-        os.makedirs(TEST_PATH)
-
     # Check if batch_size was provided via indirect parametrization
     batch_size = getattr(request, "param", None)
 
@@ -37,13 +38,13 @@ def chroma_db(mock_embedder, request):
     if batch_size is not None:
         db = ChromaDb(
             collection=TEST_COLLECTION,
-            path=TEST_PATH,
+            path=str(tmp_path),
             persistent_client=False,
             embedder=mock_embedder,
             batch_size=batch_size,
         )
     else:
-        db = ChromaDb(collection=TEST_COLLECTION, path=TEST_PATH, persistent_client=False, embedder=mock_embedder)
+        db = ChromaDb(collection=TEST_COLLECTION, path=str(tmp_path), persistent_client=False, embedder=mock_embedder)
 
     db.create()
     yield db
@@ -54,13 +55,30 @@ def chroma_db(mock_embedder, request):
     except Exception:
         pass
 
-    if os.path.exists(TEST_PATH):
-        shutil.rmtree(TEST_PATH)
-
 
 @pytest.fixture
-def sample_documents() -> List[Document]:
-    """Fixture to create sample documents"""
+def make_chroma_db(mock_embedder, tmp_path):
+    """Factory for ChromaDb instances with custom settings, created in tmp_path and dropped at teardown."""
+    dbs: List[ChromaDb] = []
+
+    def make(collection: str, **kwargs) -> ChromaDb:
+        db = ChromaDb(
+            collection=collection, path=str(tmp_path), persistent_client=False, embedder=mock_embedder, **kwargs
+        )
+        db.create()
+        dbs.append(db)
+        return db
+
+    yield make
+
+    for db in dbs:
+        try:
+            db.drop()
+        except Exception:
+            pass
+
+
+def _sample_documents() -> List[Document]:
     return [
         Document(
             content="Tom Kha Gai is a Thai coconut soup with chicken",
@@ -80,6 +98,27 @@ def sample_documents() -> List[Document]:
     ]
 
 
+@pytest.fixture
+def sample_documents() -> List[Document]:
+    """Fixture to create sample documents"""
+    return _sample_documents()
+
+
+@pytest.fixture(scope="module")
+def populated_chroma_db(mock_embedder, tmp_path_factory):
+    """ChromaDb holding the sample documents, inserted once and shared by the read-only tests of this module."""
+    db = ChromaDb(
+        collection="test_populated",
+        path=str(tmp_path_factory.mktemp("chromadb")),
+        persistent_client=False,
+        embedder=mock_embedder,
+    )
+    db.create()
+    db.insert(content_hash="test_hash", documents=_sample_documents())
+    yield db
+    db.drop()
+
+
 def test_create_collection(chroma_db):
     """Test creating a collection"""
     assert chroma_db.exists() is True
@@ -92,12 +131,10 @@ def test_insert_documents(chroma_db, sample_documents):
     assert chroma_db.get_count() == 3
 
 
-def test_search_documents(chroma_db, sample_documents):
+def test_search_documents(populated_chroma_db):
     """Test searching documents"""
-    chroma_db.insert(content_hash="test_hash", documents=sample_documents)
-
     # Search for coconut-related dishes
-    results = chroma_db.search("coconut dishes", limit=2)
+    results = populated_chroma_db.search("coconut dishes", limit=2)
     assert len(results) == 2
     assert any("coconut" in doc.content.lower() for doc in results)
 
@@ -258,11 +295,10 @@ def test_edge_case_metadata_types(chroma_db):
     assert "42" in flattened["mixed_array"]
 
 
-def test_name_exists(chroma_db, sample_documents):
+def test_name_exists(populated_chroma_db):
     """Test name existence check"""
-    chroma_db.insert(content_hash="test_hash", documents=[sample_documents[0]])
-    assert chroma_db.name_exists("tom_kha") is True
-    assert chroma_db.name_exists("nonexistent") is False
+    assert populated_chroma_db.name_exists("tom_kha") is True
+    assert populated_chroma_db.name_exists("nonexistent") is False
 
 
 def test_delete_by_id(chroma_db, sample_documents):
@@ -271,10 +307,7 @@ def test_delete_by_id(chroma_db, sample_documents):
     assert chroma_db.get_count() == 3
 
     # Get the actual ID that was generated for the first document
-    from hashlib import md5
-
-    cleaned_content = sample_documents[0].content.replace("\x00", "\ufffd")
-    doc_id = md5(cleaned_content.encode()).hexdigest()
+    doc_id = _content_id(sample_documents[0].content)
 
     # Delete by ID - may not work with current implementation
     result = chroma_db.delete_by_id(doc_id)
@@ -309,29 +342,22 @@ def test_delete_by_name(chroma_db, sample_documents):
     assert chroma_db.get_count() == 2
 
 
-def test_delete_by_metadata(chroma_db, sample_documents):
+@pytest.mark.parametrize(
+    "metadata, expected_result, expected_count",
+    [
+        ({"cuisine": "Thai"}, True, 0),
+        ({"type": "soup"}, True, 2),  # Should only delete tom_kha
+        ({"cuisine": "Italian"}, False, 3),  # Non-existent metadata
+    ],
+)
+def test_delete_by_metadata(chroma_db, sample_documents, metadata, expected_result, expected_count):
     """Test deleting documents by metadata"""
     chroma_db.insert(content_hash="test_hash", documents=sample_documents)
     assert chroma_db.get_count() == 3
 
-    # Delete by single metadata condition - should work
-    result = chroma_db.delete_by_metadata({"cuisine": "Thai"})
-    assert result is True
-    assert chroma_db.get_count() == 0
-
-    # Insert again and test single metadata condition
-    chroma_db.insert(content_hash="test_hash", documents=sample_documents)
-    assert chroma_db.get_count() == 3
-
-    # Delete by single metadata condition
-    result = chroma_db.delete_by_metadata({"type": "soup"})
-    assert result is True
-    assert chroma_db.get_count() == 2  # Should only delete tom_kha
-
-    # Try to delete by non-existent metadata
-    result = chroma_db.delete_by_metadata({"cuisine": "Italian"})
-    assert result is False
-    assert chroma_db.get_count() == 2
+    result = chroma_db.delete_by_metadata(metadata)
+    assert result is expected_result
+    assert chroma_db.get_count() == expected_count
 
 
 def test_delete_by_content_id(chroma_db, sample_documents):
@@ -390,7 +416,14 @@ def test_delete_by_name_multiple_documents(chroma_db):
     assert chroma_db.name_exists("pad_thai") is True
 
 
-def test_delete_by_metadata_simple(chroma_db):
+@pytest.mark.parametrize(
+    "metadata, expected_count",
+    [
+        ({"cuisine": "Thai"}, 1),  # Should only leave the Italian recipe
+        ({"spicy": False}, 1),  # Should only leave the spicy Thai soup
+    ],
+)
+def test_delete_by_metadata_simple(chroma_db, metadata, expected_count):
     """Test deleting documents with simple metadata matching"""
     docs = [
         Document(
@@ -413,19 +446,9 @@ def test_delete_by_metadata_simple(chroma_db):
     chroma_db.insert(documents=docs, content_hash="test_hash")
     assert chroma_db.get_count() == 3
 
-    # Delete by single metadata condition
-    result = chroma_db.delete_by_metadata({"cuisine": "Thai"})
+    result = chroma_db.delete_by_metadata(metadata)
     assert result is True
-    assert chroma_db.get_count() == 1  # Should only leave Italian recipe
-
-    # Insert again for next test
-    chroma_db.insert(documents=docs[:2], content_hash="test_hash")
-    assert chroma_db.get_count() == 3
-
-    # Delete by another single metadata condition
-    result = chroma_db.delete_by_metadata({"spicy": False})
-    assert result is True
-    assert chroma_db.get_count() == 1  # Should only leave the spicy Thai soup
+    assert chroma_db.get_count() == expected_count
 
 
 def test_delete_collection(chroma_db, sample_documents):
@@ -437,28 +460,14 @@ def test_delete_collection(chroma_db, sample_documents):
     assert chroma_db.exists() is False
 
 
-def test_distance_metrics():
+def test_distance_metrics(make_chroma_db):
     """Test different distance metrics"""
-    # Ensure the test directory exists
-    os.makedirs(TEST_PATH, exist_ok=True)
-
-    db_cosine = ChromaDb(collection="test_cosine", path=TEST_PATH, distance=Distance.cosine)
-    db_cosine.create()
-
-    db_euclidean = ChromaDb(collection="test_euclidean", path=TEST_PATH, distance=Distance.l2)
-    db_euclidean.create()
+    db_cosine = make_chroma_db("test_cosine", distance=Distance.cosine)
+    db_euclidean = make_chroma_db("test_euclidean", distance=Distance.l2)
 
     assert db_cosine._collection is not None
     assert db_euclidean._collection is not None
 
-    # Cleanup
-    try:
-        db_cosine.drop()
-        db_euclidean.drop()
-    finally:
-        if os.path.exists(TEST_PATH):
-            shutil.rmtree(TEST_PATH)
-
 
 def test_get_count(chroma_db, sample_documents):
     """Test document count"""
@@ -478,22 +487,11 @@ def test_error_handling(chroma_db):
     assert chroma_db.get_count() == 0
 
 
-def test_custom_embedder(mock_embedder):
+def test_custom_embedder(mock_embedder, make_chroma_db):
     """Test using a custom embedder"""
-    # Ensure the test directory exists
-    os.makedirs(TEST_PATH, exist_ok=True)
-
-    db = ChromaDb(collection=TEST_COLLECTION, path=TEST_PATH, embedder=mock_embedder)
-    db.create()
+    db = make_chroma_db(TEST_COLLECTION)
     assert db.embedder == mock_embedder
 
-    # Cleanup
-    try:
-        db.drop()
-    finally:
-        if os.path.exists(TEST_PATH):
-            shutil.rmtree(TEST_PATH)
-
 
 def test_multiple_document_operations(chroma_db, sample_documents):
     """Test multiple document operations including batch inserts"""
@@ -529,8 +527,7 @@ async def test_async_create_collection(chroma_db):
 async def test_async_insert_documents(chroma_db, sample_documents):
     """Test inserting documents asynchronously"""
     # Set embeddings on documents to avoid None embeddings issue
-    for doc in sample_documents:
-        doc.embedding = chroma_db.embedder.get_embedding(doc.content)
+    _embed_documents(chroma_db.embedder, sample_documents)
 
     await chroma_db.async_insert(content_hash="test_hash", documents=sample_documents)
     assert chroma_db.get_count() == 3
@@ -540,8 +537,7 @@ async def test_async_insert_documents(chroma_db, sample_documents):
 async def test_async_search_documents(chroma_db, sample_documents):
     """Test searching documents asynchronously"""
     # Set embeddings on documents to avoid None embeddings issue
-    for doc in sample_documents:
-        doc.embedding = chroma_db.embedder.get_embedding(doc.content)
+    _embed_documents(chroma_db.embedder, sample_documents)
 
     await chroma_db.async_insert(content_hash="test_hash", documents=sample_documents)
 
@@ -738,123 +734,88 @@ def test_rrf_score_calculation():
 # =============================================================================
 
 
-def test_default_search_type(mock_embedder):
+def test_default_search_type(mock_embedder, tmp_path):
     """Test that default search type is vector."""
-    os.makedirs(TEST_PATH, exist_ok=True)
-    try:
-        db = ChromaDb(
-            collection="test_default_search",
-            path=TEST_PATH,
-            persistent_client=False,
-            embedder=mock_embedder,
-        )
-        assert db.search_type == SearchType.vector
-    finally:
-        if os.path.exists(TEST_PATH):
-            shutil.rmtree(TEST_PATH)
+    db = ChromaDb(
+        collection="test_default_search",
+        path=str(tmp_path),
+        persistent_client=False,
+        embedder=mock_embedder,
+    )
+    assert db.search_type == SearchType.vector
 
 
-def test_vector_search_type_config(mock_embedder):
+def test_vector_search_type_config(mock_embedder, tmp_path):
     """Test vector search type configuration."""
-    os.makedirs(TEST_PATH, exist_ok=True)
-    try:
-        db = ChromaDb(
-            collection="test_vector_search",
-            path=TEST_PATH,
-            persistent_client=False,
-            embedder=mock_embedder,
-            search_type=SearchType.vector,
-        )
-        assert db.search_type == SearchType.vector
-    finally:
-        if os.path.exists(TEST_PATH):
-            shutil.rmtree(TEST_PATH)
+    db = ChromaDb(
+        collection="test_vector_search",
+        path=str(tmp_path),
+        persistent_client=False,
+        embedder=mock_embedder,
+        search_type=SearchType.vector,
+    )
+    assert db.search_type == SearchType.vector
 
 
-def test_keyword_search_type_config(mock_embedder):
+def test_keyword_search_type_config(mock_embedder, tmp_path):
     """Test keyword search type configuration."""
-    os.makedirs(TEST_PATH, exist_ok=True)
-    try:
-        db = ChromaDb(
-            collection="test_keyword_search",
-            path=TEST_PATH,
-            persistent_client=False,
-            embedder=mock_embedder,
-            search_type=SearchType.keyword,
-        )
-        assert db.search_type == SearchType.keyword
-    finally:
-        if os.path.exists(TEST_PATH):
-            shutil.rmtree(TEST_PATH)
+    db = ChromaDb(
+        collection="test_keyword_search",
+        path=str(tmp_path),
+        persistent_client=False,
+        embedder=mock_embedder,
+        search_type=SearchType.keyword,
+    )
+    assert db.search_type == SearchType.keyword
 
 
-def test_hybrid_search_type_config(mock_embedder):
+def test_hybrid_search_type_config(mock_embedder, tmp_path):
     """Test hybrid search type configuration."""
-    os.makedirs(TEST_PATH, exist_ok=True)
-    try:
-        db = ChromaDb(
-            collection="test_hybrid_search",
-            path=TEST_PATH,
-            persistent_client=False,
-            embedder=mock_embedder,
-            search_type=SearchType.hybrid,
-        )
-        assert db.search_type == SearchType.hybrid
-    finally:
-        if os.path.exists(TEST_PATH):
-            shutil.rmtree(TEST_PATH)
+    db = ChromaDb(
+        collection="test_hybrid_search",
+        path=str(tmp_path),
+        persistent_client=False,
+        embedder=mock_embedder,
+        search_type=SearchType.hybrid,
+    )
+    assert db.search_type == SearchType.hybrid
 
 
-def test_hybrid_rrf_k_default(mock_embedder):
+def test_hybrid_rrf_k_default(mock_embedder, tmp_path):
     """Test default hybrid_rrf_k value."""
-    os.makedirs(TEST_PATH, exist_ok=True)
-    try:
-        db = ChromaDb(
-            collection="test_rrf_default",
-            path=TEST_PATH,
-            persistent_client=False,
-            embedder=mock_embedder,
-        )
-        assert db.hybrid_rrf_k == 60
-    finally:
-        if os.path.exists(TEST_PATH):
-            shutil.rmtree(TEST_PATH)
+    db = ChromaDb(
+        collection="test_rrf_default",
+        path=str(tmp_path),
+        persistent_client=False,
+        embedder=mock_embedder,
+    )
+    assert db.hybrid_rrf_k == 60
 
 
-def test_hybrid_rrf_k_custom(mock_embedder):
+def test_hybrid_rrf_k_custom(mock_embedder, tmp_path):
     """Test custom hybrid_rrf_k value."""
-    os.makedirs(TEST_PATH, exist_ok=True)
-    try:
-        db = ChromaDb(
-            collection="test_rrf_custom",
-            path=TEST_PATH,
-            persistent_client=False,
-            embedder=mock_embedder,
-            hybrid_rrf_k=30,
-        )
-        assert db.hybrid_rrf_k == 30
-    finally:
-        if os.path.exists(TEST_PATH):
-            shutil.rmtree(TEST_PATH)
+    db = ChromaDb(
+        collection="test_rrf_custom",
+        path=str(tmp_path),
+        persistent_client=False,
+        embedder=mock_embedder,
+        hybrid_rrf_k=30,
+    )
+    assert db.hybrid_rrf_k == 30
 
 
-def test_get_supported_search_types(mock_embedder):
+def test_get_supported_search_types(mock_embedder, tmp_path):
     """Test that get_supported_search_types returns correct types."""
-    os.makedirs(TEST_PATH, exist_ok=True)
-    try:
-        db = ChromaDb(
-            collection="test_supported_types",
-            path=TEST_PATH,
-            persistent_client=False,
-            embedder=mock_embedder,
-        )
-        supported = db.get_supported_search_types()
-        assert SearchType.vector in supported
-        assert SearchType.keyword in supported
-        assert SearchType.hybrid in supported
-    finally:
-        if os.path.exists(TEST_PATH):
-            shutil.rmtree(TEST_PATH)
+    db = ChromaDb(
+        collection="test_supported_types",
+        path=str(tmp_path),
+        persistent_client=False,
+        embedder=mock_embedder,
+    )
+    supported = db.get_supported_search_types()
+    assert SearchType.vector in supported
+    assert SearchType.keyword in supported
+    assert SearchType.hybrid in supported
 
 
 # =============================================================================
@@ -862,11 +823,9 @@ def test_get_supported_search_types(mock_embedder):
 # =============================================================================
 
 
-def test_vector_search_basic(chroma_db, sample_documents):
+def test_vector_search_basic(populated_chroma_db):
     """Test basic vector search."""
-    chroma_db.insert(content_hash="test_hash", documents=sample_documents)
-
-    results = chroma_db._vector_search("coconut soup", limit=2)
+    results = populated_chroma_db._vector_search("coconut soup", limit=2)
     assert len(results) == 2
     assert all(isinstance(doc, Document) for doc in results)
 
@@ -877,14 +836,12 @@ def test_vector_search_empty_collection(chroma_db):
     assert len(results) == 0
 
 
-def test_vector_search_with_limit(chroma_db, sample_documents):
+def test_vector_search_with_limit(populated_chroma_db):
     """Test vector search respects limit parameter."""
-    chroma_db.insert(content_hash="test_hash", documents=sample_documents)
-
-    results = chroma_db._vector_search("Thai food", limit=1)
+    results = populated_chroma_db._vector_search("Thai food", limit=1)
     assert len(results) == 1
 
-    results = chroma_db._vector_search("Thai food", limit=10)
+    results = populated_chroma_db._vector_search("Thai food", limit=10)
     assert len(results) == 3  # Only 3 documents in collection
 
 
@@ -893,28 +850,22 @@ def test_vector_search_with_limit(chroma_db, sample_documents):
 # =============================================================================
 
 
-def test_keyword_search_basic(chroma_db, sample_documents):
+def test_keyword_search_basic(populated_chroma_db):
     """Test basic keyword search."""
-    chroma_db.insert(content_hash="test_hash", documents=sample_documents)
-
-    results = chroma_db._keyword_search("coconut", limit=5)
+    results = populated_chroma_db._keyword_search("coconut", limit=5)
     # Should find documents containing "coconut"
     assert all(isinstance(doc, Document) for doc in results)
 
 
-def test_keyword_search_empty_query(chroma_db, sample_documents):
+def test_keyword_search_empty_query(populated_chroma_db):
     """Test keyword search with empty query."""
-    chroma_db.insert(content_hash="test_hash", documents=sample_documents)
-
-    results = chroma_db._keyword_search("", limit=5)
+    results = populated_chroma_db._keyword_search("", limit=5)
     assert len(results) == 0
 
 
-def test_keyword_search_no_match(chroma_db, sample_documents):
+def test_keyword_search_no_match(populated_chroma_db):
     """Test keyword search with no matching documents."""
-    chroma_db.insert(content_hash="test_hash", documents=sample_documents)
-
-    results = chroma_db._keyword_search("pizza", limit=5)
+    results = populated_chroma_db._keyword_search("pizza", limit=5)
     # May return empty or results depending on ChromaDB behavior
     assert isinstance(results, list)
 
@@ -925,17 +876,11 @@ def test_keyword_search_no_match(chroma_db, sample_documents):
 
 
 @pytest.fixture
-def hybrid_chroma_db(mock_embedder):
+def hybrid_chroma_db(mock_embedder, tmp_path):
     """Fixture to create a ChromaDb instance with hybrid search enabled."""
-    os.makedirs(TEST_PATH, exist_ok=True)
-
-    if os.path.exists(TEST_PATH):
-        shutil.rmtree(TEST_PATH)
-        os.makedirs(TEST_PATH)
-
     db = ChromaDb(
         collection="test_hybrid",
-        path=TEST_PATH,
+        path=str(tmp_path),
         persistent_client=False,
         embedder=mock_embedder,
         search_type=SearchType.hybrid,
@@ -949,9 +894,6 @@ def hybrid_chroma_db(mock_embedder):
     except Exception:
         pass
 
-    if os.path.exists(TEST_PATH):
-        shutil.rmtree(TEST_PATH)
-
 
 def test_hybrid_search_basic(hybrid_chroma_db, sample_documents):
     """Test basic hybrid search."""
@@ -1006,73 +948,31 @@ def test_hybrid_search_dispatches_correctly(hybrid_chroma_db, sample_documents):
 # =============================================================================
 
 
-def test_search_dispatches_to_vector(mock_embedder):
+def test_search_dispatches_to_vector(make_chroma_db):
     """Test that search dispatches to _vector_search for vector type."""
-    os.makedirs(TEST_PATH, exist_ok=True)
-    try:
-        db = ChromaDb(
-            collection="test_dispatch_vector",
-            path=TEST_PATH,
-            persistent_client=False,
-            embedder=mock_embedder,
-            search_type=SearchType.vector,
-        )
-        db.create()
-
-        with patch.object(db, "_vector_search", return_value=[]) as mock_vector:
-            db.search("test query", limit=5)
-            mock_vector.assert_called_once()
+    db = make_chroma_db("test_dispatch_vector", search_type=SearchType.vector)
 
-        db.drop()
-    finally:
-        if os.path.exists(TEST_PATH):
-            shutil.rmtree(TEST_PATH)
+    with patch.object(db, "_vector_search", return_value=[]) as mock_vector:
+        db.search("test query", limit=5)
+        mock_vector.assert_called_once()
 
 
-def test_search_dispatches_to_keyword(mock_embedder):
+def test_search_dispatches_to_keyword(make_chroma_db):
     """Test that search dispatches to _keyword_search for keyword type."""
-    os.makedirs(TEST_PATH, exist_ok=True)
-    try:
-        db = ChromaDb(
-            collection="test_dispatch_keyword",
-            path=TEST_PATH,
-            persistent_client=False,
-            embedder=mock_embedder,
-            search_type=SearchType.keyword,
-        )
-        db.create()
+    db = make_chroma_db("test_dispatch_keyword", search_type=SearchType.keyword)
 
-        with patch.object(db, "_keyword_search", return_value=[]) as mock_keyword:
-            db.search("test query", limit=5)
-            mock_keyword.assert_called_once()
-
-        db.drop()
-    finally:
-        if os.path.exists(TEST_PATH):
-            shutil.rmtree(TEST_PATH)
+    with patch.object(db, "_keyword_search", return_value=[]) as mock_keyword:
+        db.search("test query", limit=5)
+        mock_keyword.assert_called_once()
 
 
-def test_search_dispatches_to_hybrid(mock_embedder):
+def test_search_dispatches_to_hybrid(make_chroma_db):
     """Test that search dispatches to _hybrid_search for hybrid type."""
-    os.makedirs(TEST_PATH, exist_ok=True)
-    try:
-        db = ChromaDb(
-            collection="test_dispatch_hybrid",
-            path=TEST_PATH,
-            persistent_client=False,
-            embedder=mock_embedder,
-            search_type=SearchType.hybrid,
-        )
-        db.create()
+    db = make_chroma_db("test_dispatch_hybrid", search_type=SearchType.hybrid)
 
-        with patch.object(db, "_hybrid_search", return_value=[]) as mock_hybrid:
-            db.search("test query", limit=5)
-            mock_hybrid.assert_called_once()
-
-        db.drop()
-    finally:
-        if os.path.exists(TEST_PATH):
-            shutil.rmtree(TEST_PATH)
+    with patch.object(db, "_hybrid_search", return_value=[]) as mock_hybrid:
+        db.search("test query", limit=5)
+        mock_hybrid.assert_called_once()
 
 
 # =============================================================================
@@ -1080,61 +980,33 @@ def test_search_dispatches_to_hybrid(mock_embedder):
 # =============================================================================
 
 
-def test_reranker_failure_returns_unranked(mock_embedder, sample_documents):
+def test_reranker_failure_returns_unranked(make_chroma_db, sample_documents):
     """Test that reranker failure returns unranked results gracefully."""
-    os.makedirs(TEST_PATH, exist_ok=True)
-    try:
-        # Create a mock reranker that raises an exception
-        mock_reranker = MagicMock()
-        mock_reranker.rerank.side_effect = Exception("Reranker API error")
-
-        db = ChromaDb(
-            collection="test_reranker_error",
-            path=TEST_PATH,
-            persistent_client=False,
-            embedder=mock_embedder,
-            reranker=mock_reranker,
-        )
-        db.create()
-        db.insert(content_hash="test_hash", documents=sample_documents)
+    # Create a mock reranker that raises an exception
+    mock_reranker = MagicMock()
+    mock_reranker.rerank.side_effect = Exception("Reranker API error")
 
-        # Search should succeed even if reranker fails
-        results = db.search("coconut", limit=2)
-        assert isinstance(results, list)
-        # Should have results (unranked) despite reranker failure
+    db = make_chroma_db("test_reranker_error", reranker=mock_reranker)
+    db.insert(content_hash="test_hash", documents=sample_documents)
 
-        db.drop()
-    finally:
-        if os.path.exists(TEST_PATH):
-            shutil.rmtree(TEST_PATH)
+    # Search should succeed even if reranker fails
+    results = db.search("coconut", limit=2)
+    assert isinstance(results, list)
+    # Should have results (unranked) despite reranker failure
 
 
-def test_reranker_success(mock_embedder, sample_documents):
+def test_reranker_success(make_chroma_db, sample_documents):
     """Test that reranker is called when provided and succeeds."""
-    os.makedirs(TEST_PATH, exist_ok=True)
-    try:
-        # Create a mock reranker that returns reranked results
-        mock_reranker = MagicMock()
-        mock_reranker.rerank.return_value = sample_documents[:1]
+    # Create a mock reranker that returns reranked results
+    mock_reranker = MagicMock()
+    mock_reranker.rerank.return_value = sample_documents[:1]
 
-        db = ChromaDb(
-            collection="test_reranker_success",
-            path=TEST_PATH,
-            persistent_client=False,
-            embedder=mock_embedder,
-            reranker=mock_reranker,
-        )
-        db.create()
-        db.insert(content_hash="test_hash", documents=sample_documents)
+    db = make_chroma_db("test_reranker_success", reranker=mock_reranker)
+    db.insert(content_hash="test_hash", documents=sample_documents)
 
-        db.search("coconut", limit=2)
-        # Reranker should have been called
-        mock_reranker.rerank.assert_called()
-
-        db.drop()
-    finally:
-        if os.path.exists(TEST_PATH):
-            shutil.rmtree(TEST_PATH)
+    db.search("coconut", limit=2)
+    # Reranker should have been called
+    mock_reranker.rerank.assert_called()
 
 
 # --- Tests for duplicate ID handling (issue #6682) ---
@@ -1224,8 +1096,7 @@ async def test_async_insert_duplicate_content_documents(chroma_db):
         Document(content="identical async content", name="async_doc_2"),
     ]
     # Pre-set embeddings to avoid async embedding issues with mock
-    for doc in documents:
-        doc.embedding = chroma_db.embedder.get_embedding(doc.content)
+    _embed_documents(chroma_db.embedder, documents)
     await chroma_db.async_insert(content_hash="test_hash", documents=documents)
     assert chroma_db.get_count() == 4
 
@@ -1238,8 +1109,7 @@ async def test_async_upsert_duplicate_content_documents(chroma_db):
         Document(content="async repeated", name="async_section_2"),
     ]
     # Pre-set embeddings to avoid async embedding issues with mock
-    for doc in documents:
-        doc.embedding = chroma_db.embedder.get_embedding(doc.content)
+    _embed_documents(chroma_db.embedder, documents)
     await chroma_db._async_upsert(content_hash="test_hash", documents=documents)
     assert chroma_db.get_count() == 2
 
@@ -1255,53 +1125,34 @@ def test_insert_unique_ids_generated(chroma_db):
     assert len(set(ids)) == 10, "Generated IDs must be unique"
 
 
-def test_sync_async_id_consistency(mock_embedder):
+def test_sync_async_id_consistency(mock_embedder, make_chroma_db):
     """Verify that sync and async methods generate the same IDs for the same input."""
     import asyncio
 
-    os.makedirs(TEST_PATH, exist_ok=True)
-    try:
-        content_hash = "consistency_hash"
-        mock_embedding = mock_embedder.get_embedding("test")
+    content_hash = "consistency_hash"
+    mock_embedding = mock_embedder.get_embedding("test")
 
-        # Sync
-        db_sync = ChromaDb(
-            collection="test_sync_ids",
-            path=TEST_PATH,
-            persistent_client=False,
-            embedder=mock_embedder,
-        )
-        db_sync.create()
-        docs_sync = [
-            Document(content="content A", name="doc_a"),
-            Document(content="content B", name="doc_b"),
-        ]
-        db_sync.insert(content_hash=content_hash, documents=docs_sync)
-        sync_ids = sorted(db_sync._collection.get()["ids"])
-        db_sync.drop()
-
-        # Async - pre-set embeddings to avoid mock async issues
-        db_async = ChromaDb(
-            collection="test_async_ids",
-            path=TEST_PATH,
-            persistent_client=False,
-            embedder=mock_embedder,
-        )
-        db_async.create()
-        docs_async = [
-            Document(content="content A", name="doc_a"),
-            Document(content="content B", name="doc_b"),
-        ]
-        for doc in docs_async:
-            doc.embedding = mock_embedding
-        asyncio.run(db_async.async_insert(content_hash=content_hash, documents=docs_async))
-        async_ids = sorted(db_async._collection.get()["ids"])
-        db_async.drop()
-
-        assert sync_ids == async_ids, f"Sync IDs {sync_ids} != Async IDs {async_ids}"
-    finally:
-        if os.path.exists(TEST_PATH):
-            shutil.rmtree(TEST_PATH)
+    # Sync
+    db_sync = make_chroma_db("test_sync_ids")
+    docs_sync = [
+        Document(content="content A", name="doc_a"),
+        Document(content="content B", name="doc_b"),
+    ]
+    db_sync.insert(content_hash=content_hash, documents=docs_sync)
+    sync_ids = sorted(db_sync._collection.get()["ids"])
+
+    # Async - pre-set embeddings to avoid mock async issues
+    db_async = make_chroma_db("test_async_ids")
+    docs_async = [
+        Document(content="content A", name="doc_a"),
+        Document(content="content B", name="doc_b"),
+    ]
+    for doc in docs_async:
+        doc.embedding = mock_embedding
+    asyncio.run(db_async.async_insert(content_hash=content_hash, documents=docs_async))
+    async_ids = sorted(db_async._collection.get()["ids"])
+
+    assert sync_ids == async_ids, f"Sync IDs {sync_ids} != Async IDs {async_ids}"
 
 
 # =============================================================================
@@ -1372,8 +1223,7 @@ async def test_async_insert_large_batch_exceeds_limit(chroma_db):
         for i in range(num_documents)
     ]
 
-    for doc in documents:
-        doc.embedding = chroma_db.embedder.get_embedding(doc.content)
+    _embed_documents(chroma_db.embedder, documents)
 
     await chroma_db.async_insert(content_hash="test_hash_async", documents=documents)
 
@@ -1397,8 +1247,7 @@ async def test_async_upsert_large_batch_exceeds_limit(chroma_db):
         for i in range(num_documents)
     ]
 
-    for doc in documents:
-        doc.embedding = chroma_db.embedder.get_embedding(doc.content)
+    _embed_documents(chroma_db.embedder, documents)
 
     await chroma_db.async_upsert(content_hash="test_hash_async_upsert", documents=documents)
 
@@ -1486,8 +1335,7 @@ async def test_async_insert_runs_batch_on_worker_thread(chroma_db, sample_docume
     """Ensure async_insert offloads the synchronous ChromaDB batch to a worker thread."""
     from threading import get_ident
 
-    for doc in sample_documents:
-        doc.embedding = chroma_db.embedder.get_embedding(doc.content)
+    _embed_documents(chroma_db.embedder, sample_documents)
 
     main_thread_id = get_ident()
     batch_thread_ids: List[int] = []
@@ -1513,8 +1361,7 @@ async def test_async_upsert_runs_batch_on_worker_thread(chroma_db, sample_docume
     """Ensure async_upsert offloads the synchronous ChromaDB batch to a worker thread."""
     from threading import get_ident
 
-    for doc in sample_documents:
-        doc.embedding = chroma_db.embedder.get_embedding(doc.content)
+    _embed_documents(chroma_db.embedder, sample_documents)
 
     main_thread_id = get_ident()
     batch_thread_ids: List[int] = []
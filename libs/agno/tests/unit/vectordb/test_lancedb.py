@@ -1,5 +1,5 @@
-import os
-import shutil
+import json
+from hashlib import md5
 from typing import List
 
 import pytest
@@ -9,18 +9,19 @@ from agno.vectordb.lancedb import LanceDb
 from agno.vectordb.search import SearchType
 
 TEST_TABLE = "test_table"
-TEST_PATH = "tmp/test_lancedb"
+
+
+def _doc_id(document: Document, content_hash: str) -> str:
+    """ID LanceDb generates for a document inserted with `content_hash`."""
+    cleaned_content = document.content.replace("\x00", "\ufffd")
+    base_id = document.id or md5(cleaned_content.encode()).hexdigest()
+    return md5(f"{base_id}_{content_hash}".encode()).hexdigest()
 
 
 @pytest.fixture
-def lance_db(mock_embedder):
+def lance_db(mock_embedder, tmp_path):
     """Fixture to create and clean up a LanceDb instance"""
-    os.makedirs(TEST_PATH, exist_ok=True)
-    if os.path.exists(TEST_PATH):
-        shutil.rmtree(TEST_PATH)
-        os.makedirs(TEST_PATH)
-
-    db = LanceDb(uri=TEST_PATH, table_name=TEST_TABLE, embedder=mock_embedder)
+    db = LanceDb(uri=str(tmp_path), table_name=TEST_TABLE, embedder=mock_embedder)
     db.create()
     yield db
 
@@ -29,9 +30,6 @@ def lance_db(mock_embedder):
     except Exception:
         pass
 
-    if os.path.exists(TEST_PATH):
-        shutil.rmtree(TEST_PATH)
-
 
 @pytest.fixture
 def sample_documents() -> List[Document]:
@@ -74,15 +72,7 @@ def test_vector_search(lance_db, sample_documents):
     assert results is not None
     assert len(results) == 2
     # results is a list of dicts (LanceDB .to_list()), check payload for content
-    import json
-
-    found = False
-    for row in results:
-        payload = json.loads(row["payload"])
-        if "coconut" in payload["content"].lower():
-            found = True
-            break
-    assert found
+    assert any("coconut" in json.loads(row["payload"])["content"].lower() for row in results)
 
 
 def test_keyword_search(lance_db, sample_documents):
@@ -132,11 +122,7 @@ def test_id_exists(lance_db, sample_documents):
     lance_db.insert(documents=[sample_documents[0]], content_hash=content_hash)
 
     # Get the actual ID that was generated (MD5 hash of base_id_content_hash)
-    from hashlib import md5
-
-    cleaned_content = sample_documents[0].content.replace("\x00", "\ufffd")
-    base_id = sample_documents[0].id or md5(cleaned_content.encode()).hexdigest()
-    expected_id = md5(f"{base_id}_{content_hash}".encode()).hexdigest()
+    expected_id = _doc_id(sample_documents[0], content_hash)
 
     assert lance_db.id_exists(expected_id) is True
     assert lance_db.id_exists("nonexistent_id") is False
@@ -149,11 +135,7 @@ def test_delete_by_id(lance_db, sample_documents):
     assert lance_db.get_count() == 3
 
     # Get the actual ID that was generated for the first document
-    from hashlib import md5
-
-    cleaned_content = sample_documents[0].content.replace("\x00", "\ufffd")
-    base_id = sample_documents[0].id or md5(cleaned_content.encode()).hexdigest()
-    doc_id = md5(f"{base_id}_{content_hash}".encode()).hexdigest()
+    doc_id = _doc_id(sample_documents[0], content_hash)
 
     # Delete by ID
     result = lance_db.delete_by_id(doc_id)
@@ -314,20 +296,26 @@ def test_error_handling(lance_db):
     assert lance_db.get_count() == 0
 
 
-def test_bad_vectors_handling(mock_embedder):
-    """Test handling of bad vectors"""
+@pytest.fixture
+def bad_vectors_lance_db(mock_embedder, tmp_path):
+    """Fixture for a LanceDb instance that fills bad vectors"""
     db = LanceDb(
-        uri=TEST_PATH, table_name="test_bad_vectors", on_bad_vectors="fill", fill_value=0.0, embedder=mock_embedder
+        uri=str(tmp_path), table_name="test_bad_vectors", on_bad_vectors="fill", fill_value=0.0, embedder=mock_embedder
     )
     db.create()
+    yield db
+
     try:
-        doc = Document(content="Test document", meta_data={}, name="test")
-        db.insert(documents=[doc], content_hash="test_hash")
-        assert db.get_count() == 1
-    finally:
         db.drop()
-        if os.path.exists(TEST_PATH):
-            shutil.rmtree(TEST_PATH)
+    except Exception:
+        pass
+
+
+def test_bad_vectors_handling(bad_vectors_lance_db):
+    """Test handling of bad vectors"""
+    doc = Document(content="Test document", meta_data={}, name="test")
+    bad_vectors_lance_db.insert(documents=[doc], content_hash="test_hash")
+    assert bad_vectors_lance_db.get_count() == 1
 
 
 def test_update_metadata(lance_db, sample_documents):
@@ -1,8 +1,9 @@
 import uuid
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from sqlalchemy.engine import URL, Engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from agno.knowledge.document import Document
@@ -43,6 +44,14 @@ def mock_session():
     return session
 
 
+@pytest.fixture
+def session_ctx(mock_pgvector):
+    """Session returned by `with mock_pgvector.Session() as sess:`."""
+    sess = MagicMock()
+    mock_pgvector.Session.return_value.__enter__.return_value = sess
+    return sess
+
+
 @pytest.fixture
 def sample_documents():
     """Fixture to create sample documents"""
@@ -212,19 +221,13 @@ def test_upsert(mock_pgvector):
         mock_pgvector.upsert(content_hash="test_hash", documents=docs)
 
 
-def test_insert_builds_records_and_uses_expected_ids(mock_pgvector, mock_embedder):
+def test_insert_builds_records_and_uses_expected_ids(mock_pgvector, mock_embedder, session_ctx):
     """Validate insert builds batch_records with id selection and calls sess.execute correctly."""
     docs = [
         Document(id="id-1", content="alpha", meta_data={"k": "v"}, name="A"),
         Document(content="beta", meta_data={"m": 3}, name="B"),
     ]
 
-    # Prepare session context manager mock
-    sess = MagicMock()
-    cm = MagicMock()
-    cm.__enter__.return_value = sess
-    mock_pgvector.Session.return_value = cm
-
     # Patch postgresql.insert so we don't touch real SQLAlchemy internals
     with patch("agno.vectordb.pgvector.pgvector.postgresql.insert") as mock_insert:
         insert_stmt_sentinel = object()
@@ -234,11 +237,13 @@ def test_insert_builds_records_and_uses_expected_ids(mock_pgvector, mock_embedde
         mock_pgvector.insert(content_hash, docs, filters={"tag": "t1"})
 
         # Ensure we executed with an insert statement and batch records
-        assert sess.execute.call_count == 1
-        args, kwargs = sess.execute.call_args
+        assert session_ctx.execute.call_count == 1
+        args, kwargs = session_ctx.execute.call_args
         assert args[0] is insert_stmt_sentinel
         batch_records = args[1]
         assert isinstance(batch_records, list) and len(batch_records) == 2
+        # Records go in as executemany parameters, not rendered into the statement
+        assert all(isinstance(record, dict) for record in batch_records)
 
         # IDs now include content_hash for uniqueness
         from hashlib import md5
@@ -259,22 +264,16 @@ def test_insert_builds_records_and_uses_expected_ids(mock_pgvector, mock_embedde
         assert batch_records[1]["filters"] == {"tag": "t1"}
 
         # Commit should be called
-        assert sess.commit.called
+        assert session_ctx.commit.called
 
 
-def test_upsert_builds_records_and_sets_conflict_on_id(mock_pgvector, mock_embedder):
+def test_upsert_builds_records_and_sets_conflict_on_id(mock_pgvector, mock_embedder, session_ctx):
     """Validate upsert wires values into insert and sets ON CONFLICT on id."""
     docs = [
         Document(id="cid-1", content="gamma", meta_data={"z": 9}, name="C"),
         Document(content="delta", meta_data={}, name="D"),
     ]
 
-    # Prepare session context manager mock
-    sess = MagicMock()
-    cm = MagicMock()
-    cm.__enter__.return_value = sess
-    mock_pgvector.Session.return_value = cm
-
     # Build a chain of mocks: postgresql.insert(...).values(...).on_conflict_do_update(...)
     with patch("agno.vectordb.pgvector.pgvector.postgresql.insert") as mock_insert:
         insert_stmt = MagicMock(name="insert_stmt")
@@ -306,12 +305,243 @@ def test_upsert_builds_records_and_sets_conflict_on_id(mock_pgvector, mock_embed
         assert batch_records[0]["id"] == expected_id_0  # explicit id hashed with content_hash
         assert batch_records[1]["id"] == expected_id_1  # content hash hashed with content_hash
 
-        # Ensure ON CONFLICT was invoked with index_elements=["id"] and executed
+        # Ensure ON CONFLICT was invoked with index_elements=["id"] and executed as one multi-row statement
         after_values.on_conflict_do_update.assert_called()
         args, kwargs = after_values.on_conflict_do_update.call_args
         assert "index_elements" in kwargs and kwargs["index_elements"] == ["id"]
-        assert sess.execute.call_args[0][0] is upsert_stmt
-        assert sess.commit.called
+        assert session_ctx.execute.call_args.args == (upsert_stmt,)
+        assert session_ctx.commit.called
+
+
+@pytest.mark.parametrize("batch_size, expected_batches", [(1, 5), (2, 3), (500, 1)])
+def test_insert_executes_one_statement_per_batch(mock_pgvector, batch_size, expected_batches, session_ctx):
+    """Insert should issue a single executemany per batch of documents."""
+    docs = create_test_documents(5)
+
+    with patch("agno.vectordb.pgvector.pgvector.postgresql.insert"):
+        mock_pgvector.insert("test_hash", docs, batch_size=batch_size)
+
+    assert session_ctx.execute.call_count == expected_batches
+    assert [len(call.args[1]) for call in session_ctx.execute.call_args_list] == [
+        min(batch_size, len(docs) - i) for i in range(0, len(docs), batch_size)
+    ]
+    assert session_ctx.commit.call_count == expected_batches
+
+
+@pytest.mark.parametrize("batch_size, expected_batches", [(1, 5), (2, 3), (500, 1)])
+def test_upsert_executes_one_statement_per_batch(mock_pgvector, batch_size, expected_batches, session_ctx):
+    """Upsert should issue one DELETE, then a single multi-row INSERT ... ON CONFLICT statement per batch."""
+    docs = create_test_documents(5)
+
+    with patch("agno.vectordb.pgvector.pgvector.postgresql.insert") as mock_insert:
+        mock_pgvector.upsert("test_hash", docs, batch_size=batch_size)
+
+    assert session_ctx.execute.call_count == expected_batches + 1
+    assert [len(call.args[0]) for call in mock_insert.return_value.values.call_args_list] == [
+        min(batch_size, len(docs) - i) for i in range(0, len(docs), batch_size)
+    ]
+    # The delete and every batch are committed together
+    assert session_ctx.commit.call_count == 1
+
+
+def test_upsert_deletes_content_hash_in_the_upsert_transaction(mock_pgvector, session_ctx):
+    """The content hash DELETE runs on the upsert session and is rolled back if a batch fails."""
+    docs = create_test_documents(4)
+    delete_stmt = mock_pgvector.table.delete.return_value.where.return_value
+
+    with (
+        patch("agno.vectordb.pgvector.pgvector.postgresql.insert"),
+        patch.object(mock_pgvector, "_delete_by_content_hash") as mock_delete_by_content_hash,
+    ):
+        session_ctx.execute.side_effect = [MagicMock(rowcount=2), MagicMock(), RuntimeError("upsert failed")]
+        with pytest.raises(RuntimeError, match="upsert failed"):
+            mock_pgvector.upsert("test_hash", docs, batch_size=2)
+
+    assert not mock_delete_by_content_hash.called
+    assert session_ctx.execute.call_args_list[0].args == (delete_stmt,)
+    assert not session_ctx.commit.called
+    assert session_ctx.rollback.called
+
+
+def test_insert_uses_copy_fast_path(mock_pgvector, session_ctx):
+    """With use_copy=True, insert streams rows through COPY FROM STDIN instead of executing an INSERT."""
+    docs = create_test_documents()
+    mock_pgvector.db_engine.dialect = MagicMock(driver="psycopg")
+
+    cur = session_ctx.connection.return_value.connection.driver_connection.cursor.return_value.__enter__.return_value
+    copy = cur.copy.return_value.__enter__.return_value
+
+    with patch("agno.vectordb.pgvector.pgvector.postgresql.insert") as mock_insert:
+        mock_pgvector.insert("test_hash", docs, filters={"tag": "t1"}, use_copy=True)
+
+    copy_sql = cur.copy.call_args.args[0]
+    assert copy_sql.startswith("COPY ") and copy_sql.endswith("FROM STDIN")
+    assert copy.write_row.call_count == len(docs)
+
+    row = copy.write_row.call_args_list[0].args[0]
+    assert row[-1] is None  # content_id
+    assert '"tag": "t1"' in row[2]  # meta_data serialized as JSON text
+    assert row[5].startswith("[0.1,") and row[5].endswith("]")  # embedding in pgvector text format
+
+    assert not mock_insert.called
+    assert not session_ctx.execute.called
+    assert session_ctx.commit.call_count == 1
+
+
+def test_insert_copy_falls_back_to_insert_without_psycopg(mock_pgvector, session_ctx):
+    """COPY is only wired for psycopg 3, other drivers keep using INSERT."""
+    docs = create_test_documents()
+    mock_pgvector.db_engine.dialect = MagicMock(driver="psycopg2")
+
+    with patch("agno.vectordb.pgvector.pgvector.postgresql.insert"):
+        mock_pgvector.insert("test_hash", docs, use_copy=True)
+
+    assert not session_ctx.connection.called
+    assert session_ctx.execute.call_count == 1
+
+
+def test_insert_calls_embedder_in_one_batch(mock_pgvector, session_ctx):
+    """With batch embedding enabled, insert embeds a batch with one embedder call."""
+    docs = create_test_documents()
+    embedder = MagicMock(enable_batch=True, dimensions=1024)
+    embedder.get_embeddings_batch_and_usage.return_value = ([[0.1] * 1024] * 3, [None] * 3)
+    mock_pgvector.embedder = embedder
+
+    with patch("agno.vectordb.pgvector.pgvector.postgresql.insert"):
+        mock_pgvector.insert("test_hash", docs)
+
+    embedder.get_embeddings_batch_and_usage.assert_called_once_with(
+        ["This is test document 0", "This is test document 1", "This is test document 2"]
+    )
+    assert embedder.get_embedding_and_usage.call_count == 0
+    batch_records = session_ctx.execute.call_args.args[1]
+    assert all(record["embedding"] == [0.1] * 1024 for record in batch_records)
+
+
+def test_upsert_falls_back_to_individual_embedding_when_batch_fails(mock_pgvector, session_ctx):
+    """A failed batch embedding call falls back to embedding each document."""
+    docs = create_test_documents()
+    embedder = MagicMock(enable_batch=True, dimensions=1024)
+    embedder.get_embeddings_batch_and_usage.side_effect = Exception("boom")
+    embedder.get_embedding_and_usage.return_value = ([0.2] * 1024, None)
+    mock_pgvector.embedder = embedder
+
+    with (
+        patch("agno.vectordb.pgvector.pgvector.postgresql.insert"),
+        patch.object(mock_pgvector, "_delete_by_content_hash"),
+    ):
+        mock_pgvector.upsert("test_hash", docs)
+
+    assert embedder.get_embedding_and_usage.call_count == 3
+    assert all(doc.embedding == [0.2] * 1024 for doc in docs)
+
+
+def test_insert_falls_back_to_individual_embedding_on_batch_count_mismatch(mock_pgvector, session_ctx):
+    """A batch call that returns fewer embeddings than documents does not leave documents unembedded."""
+    docs = create_test_documents()
+    embedder = MagicMock(enable_batch=True, dimensions=1024)
+    embedder.get_embeddings_batch_and_usage.return_value = ([[0.1] * 1024] * 2, [None] * 2)
+    embedder.get_embedding_and_usage.return_value = ([0.2] * 1024, None)
+    mock_pgvector.embedder = embedder
+
+    with patch("agno.vectordb.pgvector.pgvector.postgresql.insert"):
+        mock_pgvector.insert("test_hash", docs)
+
+    assert embedder.get_embedding_and_usage.call_count == 3
+    batch_records = session_ctx.execute.call_args.args[1]
+    assert all(record["embedding"] == [0.2] * 1024 for record in batch_records)
+
+
+def test_insert_raises_on_batch_embedding_rate_limit(mock_pgvector, session_ctx):
+    """A rate limited batch call is raised instead of falling back to one request per document."""
+    embedder = MagicMock(enable_batch=True, dimensions=1024)
+    embedder.get_embeddings_batch_and_usage.side_effect = Exception("Error code: 429")
+    mock_pgvector.embedder = embedder
+
+    with patch("agno.vectordb.pgvector.pgvector.postgresql.insert"):
+        with pytest.raises(Exception, match="429"):
+            mock_pgvector.insert("test_hash", create_test_documents())
+
+    assert not embedder.get_embedding_and_usage.called
+    assert not session_ctx.execute.called
+
+
+def test_bulk_load_drops_and_recreates_index(mock_pgvector):
+    """bulk_load drops an existing vector index, inserts, then rebuilds the index."""
+    docs = create_test_documents()
+    calls = MagicMock()
+
+    with (
+        patch.object(mock_pgvector, "_index_exists", return_value=True),
+        patch.object(mock_pgvector, "_drop_index") as mock_drop_index,
+        patch.object(mock_pgvector, "insert") as mock_insert,
+        patch.object(mock_pgvector, "_create_vector_index") as mock_create_vector_index,
+    ):
+        calls.attach_mock(mock_drop_index, "drop_index")
+        calls.attach_mock(mock_insert, "insert")
+        calls.attach_mock(mock_create_vector_index, "create_vector_index")
+
+        mock_pgvector.bulk_load("test_hash", docs, use_copy=True)
+
+    assert [c[0] for c in calls.mock_calls] == ["drop_index", "insert", "create_vector_index"]
+    mock_drop_index.assert_called_once_with(mock_pgvector.vector_index.name)
+    mock_insert.assert_called_once_with("test_hash", docs, filters=None, batch_size=100, use_copy=True)
+
+
+def test_bulk_load_rebuilds_index_when_insert_fails(mock_pgvector):
+    """The dropped index is restored even if the insert raises."""
+    with (
+        patch.object(mock_pgvector, "_index_exists", return_value=True),
+        patch.object(mock_pgvector, "_drop_index"),
+        patch.object(mock_pgvector, "insert", side_effect=RuntimeError("insert failed")),
+        patch.object(mock_pgvector, "_create_vector_index") as mock_create_vector_index,
+    ):
+        with pytest.raises(RuntimeError, match="insert failed"):
+            mock_pgvector.bulk_load("test_hash", create_test_documents())
+
+    mock_create_vector_index.assert_called_once()
+
+
+def test_bulk_load_keeps_insert_error_when_rebuild_also_fails(mock_pgvector):
+    """A failing rebuild after a failed insert is logged, and the insert error is raised."""
+    with (
+        patch.object(mock_pgvector, "_index_exists", return_value=True),
+        patch.object(mock_pgvector, "_drop_index"),
+        patch.object(mock_pgvector, "insert", side_effect=RuntimeError("insert failed")),
+        patch.object(mock_pgvector, "_create_vector_index", side_effect=RuntimeError("rebuild failed")),
+        patch("agno.vectordb.pgvector.pgvector.log_error") as mock_log_error,
+    ):
+        with pytest.raises(RuntimeError, match="insert failed"):
+            mock_pgvector.bulk_load("test_hash", create_test_documents())
+
+    assert any("rebuild failed" in c.args[0] for c in mock_log_error.call_args_list)
+
+
+def test_bulk_load_raises_when_rebuild_fails_after_insert(mock_pgvector):
+    """A failed rebuild after a successful insert is not swallowed."""
+    with (
+        patch.object(mock_pgvector, "_index_exists", return_value=True),
+        patch.object(mock_pgvector, "_drop_index"),
+        patch.object(mock_pgvector, "insert"),
+        patch.object(mock_pgvector, "_create_vector_index", side_effect=RuntimeError("rebuild failed")),
+    ):
+        with pytest.raises(RuntimeError, match="rebuild failed"):
+            mock_pgvector.bulk_load("test_hash", create_test_documents())
+
+
+def test_bulk_load_without_existing_index_does_not_create_one(mock_pgvector):
+    """bulk_load leaves tables without a vector index as they are."""
+    with (
+        patch.object(mock_pgvector, "_index_exists", return_value=False),
+        patch.object(mock_pgvector, "_drop_index") as mock_drop_index,
+        patch.object(mock_pgvector, "insert") as mock_insert,
+        patch.object(mock_pgvector, "_create_vector_index") as mock_create_vector_index,
+    ):
+        mock_pgvector.bulk_load("test_hash", create_test_documents())
+
+    assert mock_insert.called
+    assert not mock_drop_index.called
+    assert not mock_create_vector_index.called
 
 
 def test_search(mock_pgvector):
@@ -387,7 +617,6 @@ def test_delete(mock_pgvector):
 
 # Asynchronous Tests
 @pytest.mark.asyncio
-@pytest.mark.asyncio
 async def test_async_create(mock_pgvector):
     """Test async_create method."""
     with patch.object(mock_pgvector, "create"), patch("asyncio.to_thread") as mock_to_thread:
@@ -412,6 +641,19 @@ async def test_async_name_exists(mock_pgvector):
         mock_to_thread.assert_called_once_with(mock_pgvector.name_exists, "test_name")
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["id_exists", "content_hash_exists"])
+async def test_async_id_and_content_hash_exists(mock_pgvector, method):
+    """Without an async engine, async id/content hash checks run the sync method in a thread."""
+    with patch.object(mock_pgvector, method, return_value=True), patch("asyncio.to_thread") as mock_to_thread:
+        mock_to_thread.return_value = True
+
+        result = await getattr(mock_pgvector, f"async_{method}")("test_value")
+
+        assert result is True
+        mock_to_thread.assert_called_once_with(getattr(mock_pgvector, method), "test_value")
+
+
 @pytest.mark.asyncio
 async def test_async_insert(mock_pgvector):
     """Test async_insert method."""
@@ -435,34 +677,117 @@ async def test_async_insert(mock_pgvector):
 
 @pytest.mark.asyncio
 async def test_async_upsert(mock_pgvector):
-    """Test async_upsert method."""
+    """Test async_upsert replaces the content hash with one DELETE in its own session and no existence check."""
     docs = create_test_documents()
 
     # Mock the postgresql.insert to avoid SQLAlchemy errors with MagicMock table
+    with (
+        patch("agno.vectordb.pgvector.pgvector.postgresql.insert") as mock_insert,
+        patch.object(mock_pgvector, "content_hash_exists") as mock_content_hash_exists,
+        patch.object(mock_pgvector, "_delete_by_content_hash") as mock_delete_by_content_hash,
+        patch.object(mock_pgvector, "Session") as mock_session_class,
+    ):
+        mock_session = MagicMock()
+        mock_session_class.return_value.__enter__.return_value = mock_session
+
+        await mock_pgvector.async_upsert(content_hash="test_hash", documents=docs)
+
+        assert not mock_content_hash_exists.called
+        assert not mock_delete_by_content_hash.called
+        delete_stmt = mock_pgvector.table.delete.return_value.where.return_value
+        assert mock_session.execute.call_args_list[0].args == (delete_stmt,)
+        assert mock_session.commit.call_count == 1
+        # Verify the insert was attempted
+        mock_insert.assert_called_once_with(mock_pgvector.table)
+        values_stmt = mock_insert.return_value.values.return_value
+        values_stmt.on_conflict_do_update.assert_called_once()
+        assert values_stmt.on_conflict_do_update.call_args.kwargs["index_elements"] == ["id"]
+
+
+def _use_async_session(mock_pgvector):
+    """Wire mock_pgvector.AsyncSession to hand out a mocked native AsyncSession."""
+    sess = MagicMock(spec=AsyncSession)
+    sess.execute = AsyncMock()
+    sess.commit = AsyncMock()
+    sess.rollback = AsyncMock()
+    cm = MagicMock()
+    cm.__aenter__ = AsyncMock(return_value=sess)
+    cm.__aexit__ = AsyncMock(return_value=False)
+    mock_pgvector.AsyncSession = MagicMock(return_value=cm)
+    return sess
+
+
+@pytest.mark.asyncio
+async def test_async_insert_uses_native_async_session(mock_pgvector):
+    """With an async engine, async_insert awaits the AsyncSession and never touches the sync Session."""
+    docs = create_test_documents()
+    sess = _use_async_session(mock_pgvector)
+
     with patch("agno.vectordb.pgvector.pgvector.postgresql.insert") as mock_insert:
-        mock_stmt = MagicMock()
-        mock_values_stmt = MagicMock()
-        mock_stmt.values.return_value = mock_values_stmt
-        mock_insert.return_value = mock_stmt
+        await mock_pgvector.async_insert(content_hash="test_hash", documents=docs)
+
+    assert sess.execute.await_count == 1
+    assert sess.execute.await_args.args[0] is mock_insert.return_value
+    assert len(sess.execute.await_args.args[1]) == len(docs)
+    assert sess.commit.await_count == 1
+    assert not mock_pgvector.Session.called
+
+
+@pytest.mark.asyncio
+async def test_async_upsert_uses_native_async_session(mock_pgvector):
+    """With an async engine, _async_upsert awaits the ON CONFLICT statement on the AsyncSession."""
+    docs = create_test_documents()
+    sess = _use_async_session(mock_pgvector)
+
+    with patch("agno.vectordb.pgvector.pgvector.postgresql.insert") as mock_insert:
+        await mock_pgvector._async_upsert(content_hash="test_hash", documents=docs)
+
+    upsert_stmt = mock_insert.return_value.values.return_value.on_conflict_do_update.return_value
+    delete_stmt = mock_pgvector.table.delete.return_value.where.return_value
+    assert [call.args for call in sess.execute.await_args_list] == [(delete_stmt,), (upsert_stmt,)]
+    assert len(mock_insert.return_value.values.call_args.args[0]) == len(docs)
+    assert sess.commit.await_count == 1
+    assert not mock_pgvector.Session.called
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["name_exists", "id_exists", "content_hash_exists"])
+async def test_async_exists_checks_use_native_async_session(mock_pgvector, method):
+    """With an async engine, the async existence checks query it directly instead of using a thread."""
+    sess = _use_async_session(mock_pgvector)
+    sess.begin = MagicMock(return_value=MagicMock(__aenter__=AsyncMock(), __aexit__=AsyncMock(return_value=False)))
+    sess.execute.return_value = MagicMock(first=MagicMock(return_value=(1,)))
+
+    with (
+        patch("agno.vectordb.pgvector.pgvector.select") as mock_select,
+        patch("asyncio.to_thread") as mock_to_thread,
+    ):
+        assert await getattr(mock_pgvector, f"async_{method}")("test_value") is True
 
-        # Mock content_hash_exists to control flow
-        with patch.object(mock_pgvector, "content_hash_exists", return_value=True):
-            # Mock _delete_by_content_hash to avoid database operations
-            with patch.object(mock_pgvector, "_delete_by_content_hash"):
-                # Mock the session to avoid actual database operations
-                with patch.object(mock_pgvector, "Session") as mock_session_class:
-                    mock_session = MagicMock()
-                    mock_session_class.return_value.__enter__.return_value = mock_session
+    assert not mock_to_thread.called
+    sess.execute.assert_awaited_once_with(mock_select.return_value.where.return_value.limit.return_value)
 
-                    await mock_pgvector.async_upsert(content_hash="test_hash", documents=docs)
 
-                    # Verify the insert was attempted
-                    mock_insert.assert_called_once_with(mock_pgvector.table)
+@pytest.mark.asyncio
+async def test_async_upsert_deletes_content_hash_on_async_session(mock_pgvector):
+    """With an async engine, async_upsert awaits the content hash DELETE instead of using the sync engine."""
+    docs = create_test_documents()
+    sess = _use_async_session(mock_pgvector)
+
+    with (
+        patch("agno.vectordb.pgvector.pgvector.postgresql.insert"),
+        patch.object(mock_pgvector, "_delete_by_content_hash") as mock_delete_by_content_hash,
+    ):
+        await mock_pgvector.async_upsert(content_hash="test_hash", documents=docs)
+
+    assert not mock_delete_by_content_hash.called
+    assert sess.execute.await_args_list[0].args == (mock_pgvector.table.delete.return_value.where.return_value,)
+    assert not mock_pgvector.Session.called
 
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize("enable_batch", [False, True])
-async def test_async_upsert_429_no_write(mock_pgvector, enable_batch):
+async def test_async_upsert_429_no_write(mock_pgvector, enable_batch, session_ctx):
     """On 429 during embedding, async upsert should raise and write nothing (batch and non-batch)."""
 
     docs = [
@@ -491,11 +816,6 @@ async def test_async_upsert_429_no_write(mock_pgvector, enable_batch):
         mock_pgvector.embedder = RateLimitedEmbedder()
         embedder_patcher = patch("agno.knowledge.document.Document.async_embed", new=_raise_429)
 
-    sess = MagicMock()
-    cm = MagicMock()
-    cm.__enter__.return_value = sess
-    mock_pgvector.Session.return_value = cm
-
     with patch("agno.vectordb.pgvector.pgvector.postgresql.insert") as mock_insert:
         if embedder_patcher is not None:
             with embedder_patcher:
@@ -516,9 +836,10 @@ async def test_async_upsert_429_no_write(mock_pgvector, enable_batch):
                 )
 
         assert not mock_insert.called
-        assert not sess.execute.called
-        assert not sess.commit.called
-        assert sess.rollback.called
+        # Only the content hash DELETE ran, and it is rolled back with the failed upsert
+        session_ctx.execute.assert_called_once_with(mock_pgvector.table.delete.return_value.where.return_value)
+        assert not session_ctx.commit.called
+        assert session_ctx.rollback.called
 
 
 @pytest.mark.asyncio
@@ -760,6 +1081,21 @@ def test_delete_by_metadata_complex(mock_pgvector):
         mock_delete_by_metadata.assert_called_once_with({"spicy": False})
 
 
+def test_get_record_id_is_shared_by_sync_and_async_paths(mock_pgvector, sample_documents):
+    """Record IDs hash the explicit doc id, or the cleaned content, together with the content hash."""
+    from hashlib import md5
+
+    explicit = Document(id="doc-1", content="alpha", name="A")
+    assert mock_pgvector._get_record_id(explicit, "alpha", "h") == md5(b"doc-1_h").hexdigest()
+
+    for doc in sample_documents:
+        cleaned_content = mock_pgvector._clean_content(doc.content)
+        base_id = md5(cleaned_content.encode()).hexdigest()
+        expected_id = md5(f"{base_id}_h".encode()).hexdigest()
+        assert mock_pgvector._get_record_id(doc, cleaned_content, "h") == expected_id
+        assert mock_pgvector._get_document_record(doc, content_hash="h")["id"] == expected_id
+
+
 def test_get_document_record_merges_filters_into_metadata(mock_pgvector, mock_embedder):
     """Test that _get_document_record correctly merges filters into meta_data."""
     doc = Document(
@@ -817,7 +1153,7 @@ def test_get_document_record_with_empty_document_metadata(mock_pgvector, mock_em
     assert record["meta_data"]["filter_key"] == "filter_value"
 
 
-def test_insert_merges_filters_into_metadata(mock_pgvector, mock_embedder):
+def test_insert_merges_filters_into_metadata(mock_pgvector, mock_embedder, session_ctx):
     """Test that insert correctly merges filters into document metadata.
 
     This is a regression test for issue #6077.
@@ -831,12 +1167,6 @@ def test_insert_merges_filters_into_metadata(mock_pgvector, mock_embedder):
         ),
     ]
 
-    # Prepare session context manager mock
-    sess = MagicMock()
-    cm = MagicMock()
-    cm.__enter__.return_value = sess
-    mock_pgvector.Session.return_value = cm
-
     filters = {"knowledge_base_id": "kb-123", "source": "test"}
 
     with patch("agno.vectordb.pgvector.pgvector.postgresql.insert") as mock_insert:
@@ -846,7 +1176,7 @@ def test_insert_merges_filters_into_metadata(mock_pgvector, mock_embedder):
         mock_pgvector.insert("test_hash", docs, filters=filters)
 
         # Get the batch records that were passed to execute
-        args, kwargs = sess.execute.call_args
+        args, kwargs = session_ctx.execute.call_args
         batch_records = args[1]
 
         # Verify meta_data includes both document metadata and filters
@@ -80,6 +80,7 @@ pip install \
     pytest-asyncio \
     pytest-rerunfailures \
     pytest-timeout \
+    pytest-xdist \
     requests
 
 # Change to agno directory